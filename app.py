@@ -26,18 +26,42 @@ FEATURES:
 - Interactive security model graph
 """
 
-import dash
-from dash import Input, Output, State, html, dcc, no_update, callback, ALL
-import dash_bootstrap_components as dbc
+from dash import Input, Output, State, ClientsideFunction, html, dcc, no_update, ctx, ALL
+from flask import Response, jsonify, request
 import sys
 import os
+import difflib
+import time
+import threading
+import types
+import weakref
+import functools
+import gzip
+import hashlib
+from collections import OrderedDict
+import importlib.util
 import json
-import traceback
-import pandas as pd
+import logging
 import base64
+import csv
 import io
-import dash_cytoscape as cyto
 from datetime import datetime
+
+try:
+    import psutil
+except ImportError:  # psutil is optional; /_health then omits system metrics
+    psutil = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; Flask's stdlib JSON provider is kept
+    orjson = None
+
+try:
+    from flask_compress import Compress
+except ImportError:  # flask-compress is optional; responses then go out uncompressed
+    Compress = None
+
 from ui.themes.style_config import (
     UI_VISIBILITY,
     COMPONENT_STYLES,
@@ -45,13 +69,15 @@ from ui.themes.style_config import (
     TYPOGRAPHY,
     SPACING,
 )
-from config.settings import DEFAULT_ICONS, REQUIRED_INTERNAL_COLUMNS
+from config.settings import DEFAULT_ICONS, REQUIRED_INTERNAL_COLUMNS, get_config
+from utils.logging_config import get_logger, setup_application_logging
+
+logger = get_logger(__name__)
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-print("🚀 Starting Yōsai Enhanced Analytics Dashboard v6.0...")
-print("📊 Initializing comprehensive integrated system...")
+logger.debug("Starting Yōsai Enhanced Analytics Dashboard v6.0")
 
 # ============================================================================
 # VERSION 6.0 - ENHANCED IMPORTS WITH COMPLETE FALLBACK SUPPORT
@@ -73,223 +99,289 @@ components_available = {
 
 component_instances = {}
 
-print("🔍 Detecting available components...")
+# Components that failed to import during the last detection pass
+_missing_components = []
 
-# ENHANCED STATS COMPONENT - PRIORITY IMPORT
-try:
-    from ui.components.stats import create_enhanced_stats_component, EnhancedStatsComponent
-    components_available['enhanced_stats'] = True
-    component_instances['enhanced_stats'] = create_enhanced_stats_component()
-    print("✅ Enhanced stats component imported and instantiated")
-except ImportError as e:
-    print(f"⚠️ Enhanced stats component not available: {e}")
-    component_instances['enhanced_stats'] = None
-
-# Upload component
-try:
-    from ui.components.upload import create_enhanced_upload_component
-    components_available['upload'] = True
-    print("✅ Upload component imported")
-except ImportError as e:
-    print(f"⚠️ Upload component not available: {e}")
-    create_enhanced_upload_component = None
-
-# Mapping component
-try:
-    from ui.components.mapping import create_mapping_component
-    components_available['mapping'] = True
-    print("✅ Mapping component imported")
-except ImportError as e:
-    print(f"⚠️ Mapping component not available: {e}")
-    create_mapping_component = None
-
-# Classification component
-try:
-    from ui.components.classification import create_classification_component
-    components_available['classification'] = True
-    print("✅ Classification component imported")
-except ImportError as e:
-    print(f"⚠️ Classification component not available: {e}")
-    create_classification_component = None
-
-# Cytoscape for graphs
-try:
-    import dash_cytoscape as cyto
-    components_available['cytoscape'] = True
-    print("✅ Cytoscape available")
-except ImportError as e:
-    print(f"⚠️ Cytoscape not available: {e}")
-   
-
-# Plotly for charts
-try:
-    import plotly.express as px
-    import plotly.graph_objects as go
-    components_available['plotly'] = True
-    print("✅ Plotly available")
-except ImportError as e:
-    print(f"⚠️ Plotly not available: {e}")
-    px = None
-    go = None
-
-# Main layout
-try:
-    from ui.pages.main_page import create_main_layout
-    components_available['main_layout'] = True
-    print("✅ Main layout imported")
-except ImportError as e:
-    print(f"⚠️ Main layout not available: {e}")
-    create_main_layout = None
-
-print(f"🎯 Component Detection Complete:")
-for component, available in components_available.items():
-    status = "✅ ACTIVE" if available else "❌ FALLBACK"
-    print(f"   {component}: {status}")
+@functools.lru_cache(maxsize=None)
+def _lazy_import(module_name):
+    """Return a LazyLoader-backed module, or None if it cannot be found.
+
+    The module body only executes when one of its attributes is first accessed.
+    Results are cached so repeated ``create_app()`` calls skip the spec lookup.
+    """
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    try:
+        spec = importlib.util.find_spec(module_name)
+    except ImportError:
+        return None
+    if spec is None:
+        return None
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    loader.exec_module(module)
+    return module
+
+@functools.lru_cache(maxsize=None)
+def _pd():
+    """Import pandas on first use; only the upload and analysis callbacks need it"""
+    import pandas
+    return pandas
+
+def _lazy_factory(module_name, attr):
+    """Return a factory that executes ``module_name`` only when first called"""
+    if _lazy_import(module_name) is None:
+        return None
+    resolved = None
+
+    def factory(*args, **kwargs):
+        nonlocal resolved
+        if resolved is None:
+            resolved = getattr(importlib.import_module(module_name), attr)
+        return resolved(*args, **kwargs)
+
+    factory.__name__ = attr
+    return factory
+
+# Eagerly imported optional components:
+# (availability key, global name, module, attribute or None for the module itself)
+_OPTIONAL_IMPORTS = (
+    ('enhanced_stats', 'create_enhanced_stats_component', 'ui.components.stats', 'create_enhanced_stats_component'),
+    ('upload', 'create_enhanced_upload_component', 'ui.components.upload', 'create_enhanced_upload_component'),
+    ('main_layout', 'create_main_layout', 'ui.pages.main_page', 'create_main_layout'),
+)
+
+# Availability flags that only need a spec lookup, not an import
+_SPEC_PROBES = (
+    ('plotly', 'plotly'),
+)
+
+@functools.lru_cache(maxsize=None)
+def _detect_components():
+    """Import the optional UI components and record which ones are available
+
+    Runs once per process; later ``create_app()`` calls reuse the recorded
+    availability, factories and component instances.
+    """
+    global cyto, create_mapping_component, create_classification_component
+
+    logger.debug("Detecting available components")
+
+    _missing_components.clear()
+
+    # Cytoscape is only executed when the graph is first built; registering
+    # the lazy module up front also defers it for the ui modules importing it
+    cyto = _lazy_import('dash_cytoscape')
+    components_available['cytoscape'] = cyto is not None
+
+    for key, module_name in _SPEC_PROBES:
+        components_available[key] = importlib.util.find_spec(module_name) is not None
+        if not components_available[key]:
+            _missing_components.append(key)
+
+    for key, name, module_name, attr in _OPTIONAL_IMPORTS:
+        try:
+            module = importlib.import_module(module_name)
+            value = getattr(module, attr) if attr else module
+        except (ImportError, AttributeError) as e:
+            if key not in _missing_components:
+                _missing_components.append(key)
+            logger.debug("%s not available: %s", module_name, e)
+            value = None
+        globals()[name] = value
+
+    for key, _, _, _ in _OPTIONAL_IMPORTS:
+        components_available[key] = key not in _missing_components
+
+    # ENHANCED STATS COMPONENT - PRIORITY IMPORT
+    component_instances['enhanced_stats'] = (
+        create_enhanced_stats_component() if components_available['enhanced_stats'] else None
+    )
+
+    # Mapping and classification factories are not needed to build the
+    # layout, so their modules only execute when a factory is first called
+    create_mapping_component = _lazy_factory('ui.components.mapping', 'create_mapping_component')
+    components_available['mapping'] = create_mapping_component is not None
+
+    create_classification_component = _lazy_factory(
+        'ui.components.classification', 'create_classification_component'
+    )
+    components_available['classification'] = create_classification_component is not None
+
+    _missing_components.extend(
+        key for key in ('cytoscape', 'mapping', 'classification') if not components_available[key]
+    )
+    if _missing_components:
+        logger.warning("missing components: %s", ",".join(_missing_components))
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Component detection complete: %s",
+            ", ".join(f"{component}={'active' if available else 'fallback'}"
+                      for component, available in components_available.items())
+        )
 
 # ============================================================================
 # VERSION 6.0 - COMPREHENSIVE LAYOUT CREATION WITH FULL INTEGRATION
 # ============================================================================
 
-def create_fully_integrated_layout_v6(app_instance, main_logo_path, icon_upload_default):
-    """Create Version 6.0 comprehensive layout with all enhanced features integrated"""
-    
-    print("🎨 Creating Version 6.0 fully integrated layout...")
-    
-    # Create upload component if available
-    upload_component = None
-    if components_available['upload'] and create_enhanced_upload_component:
-        upload_component = create_enhanced_upload_component(
-            icon_upload_default,
-            app_instance.get_asset_url('upload_file_csv_icon_success.png'),
-            app_instance.get_asset_url('upload_file_csv_icon_fail.png')
-        )
-        print("✅ Enhanced upload component created")
+# Literals repeated across the layout builders, shared by reference
+_PANEL_BORDER = '1px solid #2D3748'
+_SHADOW_SM = '0 4px 6px rgba(0, 0, 0, 0.1)'
+_SHADOW_LG = '0 10px 15px rgba(0, 0, 0, 0.1)'
+_SHADOW_ACCENT = '0 4px 6px rgba(33, 150, 243, 0.3)'
+_TRANSITION = 'all 0.3s ease'
+_HEADING_TEXT_STYLE = {'color': '#F7FAFC'}
+_MUTED_TEXT_STYLE = {'color': '#A0AEC0'}
+_FALLBACK_PANEL_STYLE = {
+    'flex': '1', 'padding': '20px', 'backgroundColor': '#1A2332',
+    'margin': '10px', 'borderRadius': '8px', 'border': _PANEL_BORDER
+}
+_FALLBACK_PANEL_HIDDEN_STYLE = {**_FALLBACK_PANEL_STYLE, 'display': 'none'}
+_FLOOR_SLIDER_MARKS = {i: str(i) for i in range(0, 101, 5)}
+
+def create_fully_integrated_layout_v6(app_instance, assets):
+    """Create Version 6.0 comprehensive layout with all enhanced features integrated
+
+    ``assets`` maps the ``DEFAULT_ICONS`` keys to URLs resolved by ``create_app()``.
+    None of the layout builders use the app itself, so the tree is built once
+    per asset set and shared by every later ``create_app()``.
+    """
+    return _build_integrated_layout_v6(assets['main_logo'], assets['upload_default'])
+
+@functools.lru_cache(maxsize=1)
+def _build_integrated_layout_v6(main_logo_path, icon_upload_default):
+    """Build the integrated component tree once per asset set; it is never mutated"""
+    logger.debug("Creating Version 6.0 fully integrated layout")
     
     # Use main layout if available, otherwise create comprehensive fallback
     if components_available['main_layout'] and create_main_layout:
         try:
-            base_layout = create_main_layout(app_instance, main_logo_path, icon_upload_default)
+            # create_main_layout() keeps an app parameter for compatibility but never reads it
+            base_layout = create_main_layout(None, main_logo_path, icon_upload_default)
             enhanced_layout = _integrate_enhanced_features_into_layout_v6(base_layout, main_logo_path)
-            print("✅ Enhanced main layout with integrated features")
+            logger.debug("Enhanced main layout with integrated features")
             return enhanced_layout
         except Exception as e:
-            print(f"⚠️ Error enhancing main layout: {e}")
-            traceback.print_exc()
-            print("🔧 Falling back to comprehensive layout")
+            logger.exception("Error enhancing main layout: %s", e)
+            logger.warning("Falling back to comprehensive layout")
     
     # Create comprehensive integrated layout from scratch
-    print("🔧 Creating Version 6.0 comprehensive layout from scratch")
-    return _create_comprehensive_integrated_layout_v6(app_instance, main_logo_path, icon_upload_default)
+    logger.debug("Creating Version 6.0 comprehensive layout from scratch")
+    return _build_comprehensive_layout_v6(main_logo_path, icon_upload_default)
 
 def _integrate_enhanced_features_into_layout_v6(base_layout, main_logo_path):
     """Version 6.0 - Integrate enhanced analytics features into existing layout"""
     
     try:
         # Get base layout children
-        base_children = list(base_layout.children) if hasattr(base_layout, 'children') else []
-        enhanced_children = []
+        base_children = list(getattr(base_layout, 'children', None) or [])
         
         # Track which enhanced sections already exist
         existing_sections = set()
         
         # First pass: collect existing section IDs
-        def collect_existing_ids(children):
-            ids = set()
-            for child in children:
-                if hasattr(child, 'id') and child.id:
-                    ids.add(child.id)
-                if hasattr(child, 'children') and child.children:
-                    ids.update(collect_existing_ids(child.children if isinstance(child.children, list) else [child.children]))
-            return ids
-        
-        all_existing_ids = collect_existing_ids(base_children)
-        print(f"🔍 Found existing IDs: {all_existing_ids}")
-        ######!!!!!
-        
+        all_existing_ids = _collect_layout_ids(base_children)
+        logger.debug("Found existing IDs: %s", all_existing_ids)
+
+        # Second pass: sections keyed by id are swapped or extended in place
+        def replace_header(ch):
+            logger.debug("Replaced header with Version 6.0 enhanced version")
+            return [_create_enhanced_header_v6(main_logo_path)]
+
+        def replace_analytics(ch):
+            existing_sections.add('analytics-section')
+            logger.debug("Enhanced existing analytics section")
+            return [_create_analytics_section_v6()]
+
+        def replace_stats(ch):
+            existing_sections.add('stats-panels-container')
+            logger.debug("Replaced stats panels with enhanced version")
+            return [_create_enhanced_stats_container_v6()]
+
+        def append_missing_sections(ch):
+            sections_to_add = _build_missing_sections_v6(all_existing_ids)
+            if sections_to_add:
+                existing_sections.update(sections_to_add)
+                logger.debug("Added %d new enhanced sections", len(sections_to_add))
+            return [ch, *sections_to_add.values()]
+
+        section_handlers = {
+            'yosai-custom-header': replace_header,
+            'analytics-section': replace_analytics,
+            'stats-panels-container': replace_stats,
+            'graph-output-container': append_missing_sections,
+        }
+
         def process_children(children):
             """Recursively process children and replace sections where needed"""
             new_children = []
             for ch in children:
-                if hasattr(ch, 'id') and ch.id == 'yosai-custom-header':
-                    new_children.append(_create_enhanced_header_v6(main_logo_path))
-                    print("✅ Replaced header with Version 6.0 enhanced version")
-                
-                elif hasattr(ch, 'id') and ch.id == 'analytics-section':
-                    new_children.append(_create_analytics_section_v6())
-                    existing_sections.add('analytics-section')
-                    print("✅ Enhanced existing analytics section")
-                
-                elif hasattr(ch, 'id') and ch.id == 'stats-panels-container':
-                    new_children.append(_create_enhanced_stats_container_v6())
-                    existing_sections.add('stats-panels-container')
-                    print("✅ Replaced stats panels with enhanced version")
-                
-                elif hasattr(ch, 'id') and ch.id == 'graph-output-container':
-                    new_children.append(ch)
-
-                    sections_to_add = []
-                    if 'analytics-section' not in all_existing_ids:
-                        sections_to_add.append(_create_analytics_section_v6())
-                        existing_sections.add('analytics-section')
-                    if 'charts-section' not in all_existing_ids:
-                        sections_to_add.append(_create_charts_section_v6())
-                        existing_sections.add('charts-section')
-                    if 'export-section' not in all_existing_ids:
-                        sections_to_add.append(_create_export_section_v6())
-                        existing_sections.add('export-section')
-
-                    if sections_to_add:
-                        new_children.extend(sections_to_add)
-                        print(f"✅ Added {len(sections_to_add)} new enhanced sections")
-                else:
-                    if hasattr(ch, 'children') and ch.children:
-                        child_list = ch.children if isinstance(ch.children, list) else [ch.children]
-                        ch.children = process_children(child_list)
-                    new_children.append(ch)
+                child_id = getattr(ch, 'id', None)
+                handler = section_handlers.get(child_id) if isinstance(child_id, str) else None
+                if handler is not None:
+                    new_children.extend(handler(ch))
+                    continue
+                grandchildren = getattr(ch, 'children', None)
+                if grandchildren:
+                    ch.children = process_children(grandchildren if isinstance(grandchildren, list) else [grandchildren])
+                new_children.append(ch)
             return new_children
 
         enhanced_children = process_children(base_children)
 
-        # Add enhanced data stores    #####
-        enhanced_children.append(_create_enhanced_data_stores_v6())
+        # Add the enhanced data stores the base layout lacks
+        enhanced_children.append(_create_enhanced_data_stores_v6(all_existing_ids))
         
-        print(f"✅ Layout integration complete. Enhanced sections: {existing_sections}")
-        return html.Div(enhanced_children, style=base_layout.style if hasattr(base_layout, 'style') else {})
+        logger.debug("Layout integration complete. Enhanced sections: %s", existing_sections)
+        return html.Div(enhanced_children, style=getattr(base_layout, 'style', None) or {})
         
     except Exception as e:
-        print(f"⚠️ Error integrating enhanced features: {e}")
-        traceback.print_exc()
+        logger.exception("Error integrating enhanced features: %s", e)
         
         # Fallback: ensure all required sections exist
-        base_children = list(base_layout.children) if hasattr(base_layout, 'children') else []
+        base_children = list(getattr(base_layout, 'children', None) or [])
         
         # Check what sections we need to add
-        existing_ids = set()
-        def get_ids(children):
-            for child in children:
-                if hasattr(child, 'id') and child.id:
-                    existing_ids.add(child.id)
-                if hasattr(child, 'children'):
-                    child_list = child.children if isinstance(child.children, list) else [child.children]
-                    get_ids(child_list)
-        
-        get_ids(base_children)
+        existing_ids = _collect_layout_ids(base_children)
         
-        # Add missing sections
-        if 'analytics-section' not in existing_ids:
-            base_children.append(_create_analytics_section_v6())
-        if 'charts-section' not in existing_ids:
-            base_children.append(_create_charts_section_v6())
-        if 'export-section' not in existing_ids:
-            base_children.append(_create_export_section_v6())
-        
-        base_children.append(_create_enhanced_data_stores_v6())
+        # Add missing sections and the data stores in one extension
+        base_children.extend([
+            *_build_missing_sections_v6(existing_ids).values(),
+            _create_enhanced_data_stores_v6(existing_ids),
+        ])
         
-        print("✅ Fallback layout created with all required sections")
-        return html.Div(base_children, style=base_layout.style if hasattr(base_layout, 'style') else {})
+        logger.debug("Fallback layout created with all required sections")
+        return html.Div(base_children, style=getattr(base_layout, 'style', None) or {})
+
+def _collect_layout_ids(children):
+    """Return the string ids declared anywhere under ``children``"""
+    ids = set()
+    for child in children:
+        child_id = getattr(child, 'id', None)
+        if child_id and isinstance(child_id, str):
+            ids.add(child_id)
+        grandchildren = getattr(child, 'children', None)
+        if grandchildren:
+            ids.update(_collect_layout_ids(grandchildren if isinstance(grandchildren, list) else [grandchildren]))
+    return ids
+
+def _build_missing_sections_v6(existing_ids):
+    """Build the enhanced sections whose ids are not in ``existing_ids``, in layout order"""
+    builders = (
+        ('analytics-section', _create_analytics_section_v6),
+        ('charts-section', _create_charts_section_v6),
+        ('export-section', _create_export_section_v6),
+    )
+    return {
+        section_id: build() for section_id, build in builders if section_id not in existing_ids
+    }
 
-def _create_comprehensive_integrated_layout_v6(app_instance, main_logo_path, icon_upload_default):
-    """Version 6.0 - Create comprehensive layout with all features from scratch"""
+@functools.lru_cache(maxsize=1)
+def _build_comprehensive_layout_v6(main_logo_path, icon_upload_default):
+    """Build the fallback component tree once per asset set; it is never mutated"""
     
     return html.Div([
         # Enhanced Header with Advanced Analytics Toggle
@@ -384,7 +476,7 @@ def _create_comprehensive_upload_section_v6(icon_path):
             children=html.Div([
                 html.Img(id='upload-icon', src=icon_path, style={
                     'width': '120px', 'height': '120px', 'marginBottom': '15px',
-                    'opacity': '0.8', 'transition': 'all 0.3s ease'
+                    'opacity': '0.8', 'transition': _TRANSITION
                 }),
                 html.H3("Drop your CSV or JSON file here", style={
                     'color': '#F7FAFC', 'margin': '0', 'fontSize': '1.25rem',
@@ -401,9 +493,9 @@ def _create_comprehensive_upload_section_v6(icon_path):
                 'width': '70%', 'maxWidth': '600px', 'minHeight': '200px',
                 'borderRadius': '12px', 'textAlign': 'center', 'margin': '20px auto',
                 'display': 'flex', 'alignItems': 'center', 'justifyContent': 'center',
-                'cursor': 'pointer', 'transition': 'all 0.3s ease',
+                'cursor': 'pointer', 'transition': _TRANSITION,
                 'border': '2px dashed #2D3748', 'backgroundColor': '#1A2332',
-                'boxShadow': '0 4px 6px rgba(0, 0, 0, 0.1)'
+                'boxShadow': _SHADOW_SM
             },
             multiple=False,
             accept='.csv,.json'
@@ -437,77 +529,61 @@ def _create_comprehensive_setup_container_v6():
         html.Div(id='entrance-verification-ui-section', style={'display': 'none'}, children=[
             
             # Step 2: Facility Setup Card
-            html.Div([
+            html.Div(className='setup-card', children=[
                 html.H4("Step 2: Facility Setup", style={
                     'color': '#F7FAFC', 'textAlign': 'center', 'marginBottom': '20px',
                     'fontSize': '1.3rem', 'fontWeight': '600'
                 }),
                 
                 # Floors Slider
-                html.Div([
-                    html.Label("How many floors are in the facility?", style={
-                        'color': '#F7FAFC', 'fontWeight': 'bold', 'fontSize': '1rem',
-                        'marginBottom': '10px', 'display': 'block', 'textAlign': 'center'
-                    }),
-                    dcc.Slider(
-                        id="num-floors-input",
-                        min=1, max=50, step=1, value=4,
-                        marks={i: str(i) for i in range(0, 101, 5)},
-                        tooltip={"always_visible": False, "placement": "bottom"},
-                        updatemode="drag"
-                    ),
-                    html.Div(id="num-floors-display", children="4 floors", style={
-                        "fontSize": "0.9rem", "color": "#A0AEC0", "marginTop": "8px",
-                        "textAlign": "center", "fontWeight": "600"
-                    }),
-                    html.Small("Count floors above ground including mezzanines and secure zones.", style={
-                        'color': '#718096', 'fontSize': '0.8rem', 'textAlign': 'center',
-                        'display': 'block', 'marginTop': '8px', 'marginBottom': '24px'
-                    })
-                ]),
+                html.Label("How many floors are in the facility?", style={
+                    'color': '#F7FAFC', 'fontWeight': 'bold', 'fontSize': '1rem',
+                    'marginBottom': '10px', 'display': 'block', 'textAlign': 'center'
+                }),
+                dcc.Slider(
+                    id="num-floors-input",
+                    min=1, max=50, step=1, value=4,
+                    marks=_FLOOR_SLIDER_MARKS,
+                    tooltip={"always_visible": False, "placement": "bottom"},
+                    updatemode="drag"
+                ),
+                html.Div(id="num-floors-display", children="4 floors", style={
+                    "fontSize": "0.9rem", "color": "#A0AEC0", "marginTop": "8px",
+                    "textAlign": "center", "fontWeight": "600"
+                }),
+                html.Small("Count floors above ground including mezzanines and secure zones.",
+                           className='setup-hint', style={'marginBottom': '24px'}),
                 
                 # Manual Classification Toggle
-                html.Div([
-                    html.Label("Enable Manual Door Classification?", style={
-                        'color': '#F7FAFC', 'fontSize': '1rem', 'marginBottom': '12px',
-                        'textAlign': 'center', 'display': 'block', 'fontWeight': 'bold'
-                    }),
-                    dcc.RadioItems(
-                        id='manual-map-toggle',
-                        options=[
-                            {'label': 'No', 'value': 'no'}, 
-                            {'label': 'Yes', 'value': 'yes'}
-                        ],
-                        value='no',
-                        inline=True,
-                        className='clean-radio-toggle'
-                    ),
-                    html.Small("Choose 'Yes' to manually set security levels for each door, or 'No' for automatic classification.", style={
-                        'color': '#718096', 'fontSize': '0.8rem', 'textAlign': 'center',
-                        'display': 'block', 'marginTop': '8px'
-                    })
-                ])
-            ], style={
-                'padding': '20px', 'backgroundColor': '#1A2332', 'borderRadius': '8px',
-                'marginBottom': '20px', 'border': '1px solid #2D3748',
-                'maxWidth': '600px', 'margin': '0 auto 20px auto'
-            }),
+                html.Label("Enable Manual Door Classification?", style={
+                    'color': '#F7FAFC', 'fontSize': '1rem', 'marginBottom': '12px',
+                    'textAlign': 'center', 'display': 'block', 'fontWeight': 'bold'
+                }),
+                dcc.RadioItems(
+                    id='manual-map-toggle',
+                    options=[
+                        {'label': 'No', 'value': 'no'}, 
+                        {'label': 'Yes', 'value': 'yes'}
+                    ],
+                    value='no',
+                    inline=True,
+                    className='clean-radio-toggle'
+                ),
+                html.Small("Choose 'Yes' to manually set security levels for each door, or 'No' for automatic classification.",
+                           className='setup-hint')
+            ]),
             
             # Step 3: Door Classification (Hidden initially)
-            html.Div(id="door-classification-table-container", style={'display': 'none'}, children=[
-                html.Div([
-                    html.H4("Step 3: Door Classification", style={
-                        'color': '#F7FAFC', 'textAlign': 'center', 'marginBottom': '16px',
-                        'fontSize': '1.3rem', 'fontWeight': '600'
-                    }),
-                    html.P("Assign security levels and properties to each door:", style={
-                        'color': '#A0AEC0', 'textAlign': 'center', 'marginBottom': '12px'
-                    }),
-                    html.Div(id="door-classification-table")
-                ], style={
-                    'padding': '20px', 'backgroundColor': '#1A2332', 'borderRadius': '8px',
-                    'border': '1px solid #2D3748', 'maxWidth': '900px', 'margin': '0 auto'
-                })
+            html.Div(id="door-classification-table-container", className='setup-card setup-card-wide',
+                     style={'display': 'none'}, children=[
+                html.H4("Step 3: Door Classification", style={
+                    'color': '#F7FAFC', 'textAlign': 'center', 'marginBottom': '16px',
+                    'fontSize': '1.3rem', 'fontWeight': '600'
+                }),
+                html.P("Assign security levels and properties to each door:", style={
+                    'color': '#A0AEC0', 'textAlign': 'center', 'marginBottom': '12px'
+                }),
+                html.Div(id="door-classification-table")
             ])
         ]),
         
@@ -518,8 +594,8 @@ def _create_comprehensive_setup_container_v6():
                        'padding': '15px 30px', 'backgroundColor': '#2196F3', 'color': 'white',
                        'border': 'none', 'borderRadius': '8px', 'fontSize': '16px',
                        'fontWeight': 'bold', 'cursor': 'pointer', 'display': 'block',
-                       'margin': '30px auto', 'boxShadow': '0 4px 6px rgba(33, 150, 243, 0.3)',
-                       'transition': 'all 0.3s ease'
+                       'margin': '30px auto', 'boxShadow': _SHADOW_ACCENT,
+                       'transition': _TRANSITION
                    })
     ])
 
@@ -532,67 +608,60 @@ def _create_enhanced_stats_container_v6():
         return html.Div(id='stats-panels-container', style={'display': 'none'}, children=[
             # Basic stats fallback with ALL required IDs for Version 6.0
             html.Div([
-                html.H3("Access Events", style={'color': '#F7FAFC'}),
+                html.H3("Access Events", style=_HEADING_TEXT_STYLE),
                 html.H1(id="total-access-events-H1", style={'color': '#2196F3'}),
-                html.P(id="event-date-range-P", style={'color': '#A0AEC0'}),
+                html.P(id="event-date-range-P", style=_MUTED_TEXT_STYLE),
                 # Enhanced stats elements (hidden but present for callbacks)
                 html.P(id="avg-events-per-day", style={'display': 'none'}),
                 html.P(id="peak-activity-day", style={'display': 'none'})
-            ], style={'flex': '1', 'padding': '20px', 'backgroundColor': '#1A2332', 
-                     'margin': '10px', 'borderRadius': '8px', 'border': '1px solid #2D3748'}),
+            ], style=_FALLBACK_PANEL_STYLE),
             
             html.Div([
-                html.H3("User Analytics", style={'color': '#F7FAFC'}),
-                html.P(id="stats-date-range-P", style={'color': '#A0AEC0'}),
-                html.P(id="stats-days-with-data-P", style={'color': '#A0AEC0'}),
-                html.P(id="stats-num-devices-P", style={'color': '#A0AEC0'}),
-                html.P(id="stats-unique-tokens-P", style={'color': '#A0AEC0'}),
+                html.H3("User Analytics", style=_HEADING_TEXT_STYLE),
+                html.P(id="stats-date-range-P", style=_MUTED_TEXT_STYLE),
+                html.P(id="stats-days-with-data-P", style=_MUTED_TEXT_STYLE),
+                html.P(id="stats-num-devices-P", style=_MUTED_TEXT_STYLE),
+                html.P(id="stats-unique-tokens-P", style=_MUTED_TEXT_STYLE),
                 # Enhanced user analytics elements
-                html.P(id="stats-unique-users", style={'color': '#A0AEC0'}),
-                html.P(id="stats-avg-events-per-user", style={'color': '#A0AEC0'}),
-                html.P(id="stats-most-active-user", style={'color': '#A0AEC0'}),
-                html.P(id="stats-devices-per-user", style={'color': '#A0AEC0'}),
-                html.P(id="stats-peak-hour", style={'color': '#A0AEC0'})
-            ], style={'flex': '1', 'padding': '20px', 'backgroundColor': '#1A2332',
-                     'margin': '10px', 'borderRadius': '8px', 'border': '1px solid #2D3748'}),
+                html.P(id="stats-unique-users", style=_MUTED_TEXT_STYLE),
+                html.P(id="stats-avg-events-per-user", style=_MUTED_TEXT_STYLE),
+                html.P(id="stats-most-active-user", style=_MUTED_TEXT_STYLE),
+                html.P(id="stats-devices-per-user", style=_MUTED_TEXT_STYLE),
+                html.P(id="stats-peak-hour", style=_MUTED_TEXT_STYLE)
+            ], style=_FALLBACK_PANEL_STYLE),
             
             html.Div([
-                html.H3("Device Analytics", style={'color': '#F7FAFC'}),
-                html.P(id="total-devices-count", style={'color': '#A0AEC0'}),
-                html.P(id="entrance-devices-count", style={'color': '#A0AEC0'}),
-                html.P(id="high-security-devices", style={'color': '#A0AEC0'}),
+                html.H3("Device Analytics", style=_HEADING_TEXT_STYLE),
+                html.P(id="total-devices-count", style=_MUTED_TEXT_STYLE),
+                html.P(id="entrance-devices-count", style=_MUTED_TEXT_STYLE),
+                html.P(id="high-security-devices", style=_MUTED_TEXT_STYLE),
                 html.Table([
                     html.Thead([html.Tr([
-                        html.Th("Device", style={'color': '#F7FAFC'}), 
-                        html.Th("Events", style={'color': '#F7FAFC'})
+                        html.Th("Device", style=_HEADING_TEXT_STYLE), 
+                        html.Th("Events", style=_HEADING_TEXT_STYLE)
                     ])]),
                     html.Tbody(id='most-active-devices-table-body')
                 ])
-            ], style={'flex': '1', 'padding': '20px', 'backgroundColor': '#1A2332',
-                     'margin': '10px', 'borderRadius': '8px', 'border': '1px solid #2D3748'}),
+            ], style=_FALLBACK_PANEL_STYLE),
             
             # Additional enhanced analytics elements (hidden but present)
             html.Div([
-                html.H3("Peak Activity", style={'color': '#F7FAFC'}),
-                html.P(id="peak-hour-display", style={'color': '#A0AEC0'}),
-                html.P(id="peak-day-display", style={'color': '#A0AEC0'}),
-                html.P(id="busiest-floor", style={'color': '#A0AEC0'}),
-                html.P(id="entry-exit-ratio", style={'color': '#A0AEC0'}),
-                html.P(id="weekend-vs-weekday", style={'color': '#A0AEC0'})
-            ], style={'flex': '1', 'padding': '20px', 'backgroundColor': '#1A2332',
-                     'margin': '10px', 'borderRadius': '8px', 'border': '1px solid #2D3748',
-                     'display': 'none'}),  # Hidden by default
+                html.H3("Peak Activity", style=_HEADING_TEXT_STYLE),
+                html.P(id="peak-hour-display", style=_MUTED_TEXT_STYLE),
+                html.P(id="peak-day-display", style=_MUTED_TEXT_STYLE),
+                html.P(id="busiest-floor", style=_MUTED_TEXT_STYLE),
+                html.P(id="entry-exit-ratio", style=_MUTED_TEXT_STYLE),
+                html.P(id="weekend-vs-weekday", style=_MUTED_TEXT_STYLE)
+            ], style=_FALLBACK_PANEL_HIDDEN_STYLE),  # Hidden by default
             
             html.Div([
-                html.H3("Security Overview", style={'color': '#F7FAFC'}),
+                html.H3("Security Overview", style=_HEADING_TEXT_STYLE),
                 html.Div(id="security-level-breakdown", children=[
-                    html.P("Security analysis loading...", style={'color': '#A0AEC0'})
+                    html.P("Security analysis loading...", style=_MUTED_TEXT_STYLE)
                 ]),
-                html.P(id="compliance-score", style={'color': '#A0AEC0'}),
-                html.P(id="anomaly-alerts", style={'color': '#A0AEC0'})
-            ], style={'flex': '1', 'padding': '20px', 'backgroundColor': '#1A2332',
-                     'margin': '10px', 'borderRadius': '8px', 'border': '1px solid #2D3748',
-                     'display': 'none'})  # Hidden by default
+                html.P(id="compliance-score", style=_MUTED_TEXT_STYLE),
+                html.P(id="anomaly-alerts", style=_MUTED_TEXT_STYLE)
+            ], style=_FALLBACK_PANEL_HIDDEN_STYLE)  # Hidden by default
         ])
 
 def _create_analytics_section_v6():
@@ -683,16 +752,16 @@ def _create_export_section_v6():
             html.Div([
                 html.Button("📊 Export Stats CSV", id='export-stats-csv', 
                            style={'margin': '5px', 'padding': '8px 16px', 'backgroundColor': '#1A2332', 
-                                 'color': '#F7FAFC', 'border': '1px solid #2D3748', 'borderRadius': '4px'}),
+                                 'color': '#F7FAFC', 'border': _PANEL_BORDER, 'borderRadius': '4px'}),
                 html.Button("📈 Download Charts", id='export-charts-png', 
                            style={'margin': '5px', 'padding': '8px 16px', 'backgroundColor': '#1A2332',
-                                 'color': '#F7FAFC', 'border': '1px solid #2D3748', 'borderRadius': '4px'}),
+                                 'color': '#F7FAFC', 'border': _PANEL_BORDER, 'borderRadius': '4px'}),
                 html.Button("📄 Generate Report", id='generate-pdf-report', 
                            style={'margin': '5px', 'padding': '8px 16px', 'backgroundColor': '#2196F3',
                                  'color': 'white', 'border': 'none', 'borderRadius': '4px'}),
                 html.Button("🔄 Refresh Data", id='refresh-analytics', 
                            style={'margin': '5px', 'padding': '8px 16px', 'backgroundColor': '#1A2332',
-                                 'color': '#F7FAFC', 'border': '1px solid #2D3748', 'borderRadius': '4px'})
+                                 'color': '#F7FAFC', 'border': _PANEL_BORDER, 'borderRadius': '4px'})
             ], style={'textAlign': 'center', 'marginBottom': '20px'}),
             
             # Download components and status required by callbacks
@@ -734,7 +803,7 @@ def _create_comprehensive_graph_container_v6():
             style={
                 'height': '600px', 'display': 'flex', 'alignItems': 'center',
                 'justifyContent': 'center', 'color': '#A0AEC0', 'backgroundColor': '#1A2332',
-                'border': '1px solid #2D3748', 'borderRadius': '8px'
+                'border': _PANEL_BORDER, 'borderRadius': '8px'
             }
         )
     
@@ -747,8 +816,8 @@ def _create_comprehensive_graph_container_v6():
             graph_element
         ], style={
             'height': '600px', 'backgroundColor': '#1A2332', 'margin': '20px',
-            'borderRadius': '12px', 'border': '1px solid #2D3748',
-            'boxShadow': '0 10px 15px rgba(0, 0, 0, 0.1)'
+            'borderRadius': '12px', 'border': _PANEL_BORDER,
+            'boxShadow': _SHADOW_LG
         }),
         html.Pre(id='tap-node-data-output', children=(
             "Upload CSV, map headers, (optionally classify doors), then generate analysis. "
@@ -756,7 +825,7 @@ def _create_comprehensive_graph_container_v6():
         ), style={
             'color': '#A0AEC0', 'textAlign': 'center', 'margin': '20px', 'fontSize': '14px',
             'backgroundColor': '#1A2332', 'padding': '15px', 'borderRadius': '8px',
-            'border': '1px solid #2D3748'
+            'border': _PANEL_BORDER
         })
     ])
 
@@ -773,228 +842,313 @@ def _create_comprehensive_data_stores_v6():
         dcc.Store(id='all-doors-from-csv-store', storage_type='session'),
         dcc.Store(id='processed-data-store', storage_type='session'),  # Version 6.0: processed data
         dcc.Store(id='enhanced-metrics-store', storage_type='session'),  # Version 6.0: metrics
+        _create_column_labels_store_v6(),
     ])
 
-def _create_enhanced_data_stores_v6():
-    """Version 6.0 - Create additional data stores for enhanced features"""
-    return html.Div([
-        dcc.Store(id='processed-data-store', storage_type='session'),
-        dcc.Store(id='enhanced-metrics-store', storage_type='session'),
-    ])
+def _create_column_labels_store_v6():
+    """Required-column display labels, read by the clientside mapping check"""
+    return dcc.Store(id='required-column-labels-store', data=dict(REQUIRED_INTERNAL_COLUMNS))
 
-# ============================================================================
-# VERSION 6.0 - CREATE DASH APP WITH COMPREHENSIVE SETUP
-# ============================================================================
+# Stores the Version 6.0 callbacks need on top of whatever the base layout has
+_ENHANCED_STORE_IDS = ('processed-data-store', 'enhanced-metrics-store')
 
-app = dash.Dash(
-    __name__,
-    suppress_callback_exceptions=True,
-    assets_folder='assets',
-    external_stylesheets=[dbc.themes.DARKLY],
-    meta_tags=[
-        {"name": "viewport", "content": "width=device-width, initial-scale=1"},
-        {"name": "description", "content": "Yōsai Enhanced Analytics Dashboard v6.0 - Advanced Access Control Analytics"}
-    ]
-)
-
-server = app.server
-app.title = "Yōsai Enhanced Analytics Dashboard v6.0"
-
-# Asset paths
-ICON_UPLOAD_DEFAULT = app.get_asset_url('upload_file_csv_icon.png')
-ICON_UPLOAD_SUCCESS = app.get_asset_url('upload_file_csv_icon_success.png')
-ICON_UPLOAD_FAIL = app.get_asset_url('upload_file_csv_icon_fail.png')
-MAIN_LOGO_PATH = app.get_asset_url('logo_white.png')
+def _create_enhanced_data_stores_v6(existing_ids):
+    """Version 6.0 - Create the enhanced data stores missing from ``existing_ids``
 
-print(f"📁 Assets loaded: {ICON_UPLOAD_DEFAULT}")
-
-# Create Version 6.0 comprehensive integrated layout
-app.layout = create_fully_integrated_layout_v6(app, MAIN_LOGO_PATH, ICON_UPLOAD_DEFAULT)
-
-print("✅ Version 6.0 fully integrated layout created successfully")
-print(f"📊 Components status: {components_available}")
+    Stores the base layout already defines are left out so the integrated
+    layout never carries a duplicate id.
+    """
+    stores = [
+        dcc.Store(id=store_id, storage_type='session')
+        for store_id in _ENHANCED_STORE_IDS if store_id not in existing_ids
+    ]
+    if 'required-column-labels-store' not in existing_ids:
+        stores.append(_create_column_labels_store_v6())
+    return html.Div(stores)
 
 # ============================================================================
 # VERSION 6.0 - COMPREHENSIVE CALLBACK SYSTEM WITH ENHANCED ANALYTICS
 # ============================================================================
 
+# Constant callback responses, built once instead of on every trigger
+_HIDE_STYLE = {'display': 'none'}
+_SHOW_STYLE = {'display': 'block'}
+_STATS_PANEL_STYLE = {
+    'display': 'flex',
+    'flexDirection': 'row',
+    'justifyContent': 'space-around',
+    'gap': '20px',
+    'marginBottom': '30px',
+    'width': '95%',
+    'margin': '0 auto 30px auto'
+}
+# header, stats panels, analytics, charts, export, graph
+_ANALYSIS_VISIBLE_STYLES = (_SHOW_STYLE, _STATS_PANEL_STYLE, _SHOW_STYLE, _SHOW_STYLE, _SHOW_STYLE, _SHOW_STYLE)
+_EMPTY_FIGURE = {'data': [], 'layout': {'title': 'No data available', 'plot_bgcolor': '#0F1419', 'paper_bgcolor': '#1A2332', 'font': {'color': '#F7FAFC'}}}
+
+_SETUP_CONTAINER_STYLE = {
+    'display': 'block',
+    'padding': '25px',
+    'backgroundColor': '#1A2332',
+    'borderRadius': '12px',
+    'margin': '20px auto',
+    'width': '90%',
+    'maxWidth': '1000px',
+    'border': _PANEL_BORDER,
+    'boxShadow': _SHADOW_LG
+}
+_UPLOAD_SUCCESS_STYLE = {
+    'width': '70%', 'maxWidth': '600px', 'minHeight': '200px',
+    'borderRadius': '12px', 'textAlign': 'center', 'margin': '20px auto',
+    'display': 'flex', 'alignItems': 'center', 'justifyContent': 'center',
+    'cursor': 'pointer', 'transition': _TRANSITION,
+    'border': '2px solid #2DBE6C', 'backgroundColor': 'rgba(45, 190, 108, 0.1)',
+    'boxShadow': '0 4px 6px rgba(45, 190, 108, 0.3)'
+}
+_CONFIRM_MAPPING_BUTTON_STYLE = {
+    'display': 'block',
+    'margin': '25px auto',
+    'padding': '12px 30px',
+    'backgroundColor': '#2196F3',
+    'color': 'white',
+    'border': 'none',
+    'borderRadius': '8px',
+    'cursor': 'pointer',
+    'fontSize': '16px',
+    'fontWeight': '600',
+    'boxShadow': _SHADOW_ACCENT,
+    'transition': _TRANSITION
+}
+_MAPPING_SECTION_STYLE = {
+    'display': 'block',
+    'padding': '25px',
+    'backgroundColor': '#1A2332',
+    'borderRadius': '12px',
+    'margin': '20px auto',
+    'width': '85%',
+    'maxWidth': '700px',
+    'border': _PANEL_BORDER,
+    'boxShadow': _SHADOW_SM
+}
+
+_EMPTY_UPLOAD_RESPONSE = (None, "", None, _HIDE_STYLE, {}, None)
+_EMPTY_MAPPING_RESPONSE = ([], _HIDE_STYLE, _HIDE_STYLE)
+_NO_ANALYSIS_RESPONSE = tuple(
+    [_HIDE_STYLE] * 6 +  # Visibility
+    ['0', 'No data', [], [], "Click generate to start Version 6.0 comprehensive analysis"] +  # Basic stats
+    ['No data'] * 8 +  # Enhanced stats
+    ['No data'] * 12 +  # Advanced analytics
+    [_EMPTY_FIGURE] * 3 +  # Charts
+    [None]  # Metrics store
+)
+
+# Rows parsed at upload time for header and door-column sniffing
+_UPLOAD_SNIFF_ROWS = 10_000
+
+# Column-name fragments that mark a likely door/device ID column
+_DOOR_COLUMN_KEYWORDS = ('door', 'device', 'reader', 'access', 'card')
+
+# Sniff results for the last few distinct uploads, keyed by a digest of the
+# payload, so re-dropping the same file skips the decode and parse entirely
+_UPLOAD_SNIFF_CACHE_SIZE = 4
+_upload_sniff_cache = OrderedDict()
+_upload_sniff_lock = threading.Lock()
+
+def _sniff_csv_upload(content_string):
+    """Return the sniff result for a base64 CSV payload, reusing recent results"""
+    digest = hashlib.blake2b(content_string.encode(), digest_size=16).digest()
+    with _upload_sniff_lock:
+        sniff = _upload_sniff_cache.get(digest)
+        if sniff is not None:
+            _upload_sniff_cache.move_to_end(digest)
+            return sniff
+
+    sniff = _parse_csv_sample(base64.b64decode(content_string))
+    with _upload_sniff_lock:
+        _upload_sniff_cache[digest] = sniff
+        if len(_upload_sniff_cache) > _UPLOAD_SNIFF_CACHE_SIZE:
+            _upload_sniff_cache.popitem(last=False)
+    return sniff
+
+def _count_csv_rows(decoded):
+    """Count the data rows of a CSV the way pandas does
+
+    A C-level csv.reader pass, so quoted fields spanning lines count once
+    and blank lines are skipped, without building any columns.
+    """
+    text = io.TextIOWrapper(io.BytesIO(decoded), encoding='utf-8', newline='')
+    return max(sum(1 for row in csv.reader(text) if row) - 1, 0)
 
+def _parse_csv_sample(decoded):
+    """Parse the head of an uploaded CSV and pick its most likely door column"""
+    pd = _pd()
+    
+    # Only sniff the head of the file here; the full parse waits until
+    # the analysis callback, after the user has confirmed the mapping.
+    # Reading as str keeps door IDs verbatim (no 0012 -> 12.0).
+    df = pd.read_csv(io.BytesIO(decoded), encoding='utf-8', nrows=_UPLOAD_SNIFF_ROWS, dtype=str)
+    headers = df.columns.to_list()
+    sample_rows, column_count = df.shape
+    row_count = sample_rows
+    if sample_rows == _UPLOAD_SNIFF_ROWS:
+        row_count = _count_csv_rows(decoded)
+    logger.debug("✅ CSV loaded: %s rows, %s columns", row_count, column_count)
+    logger.debug("📋 Headers: %s", headers)
+    
+    # Enhanced door extraction with better logic
+    doors = []
+    door_column_candidates = []
+    
+    # Check columns whose name suggests they contain door/device IDs;
+    # one DataFrame.nunique() pass counts all of them at once
+    keyword_idxs = [
+        col_idx for col_idx, col_name in enumerate(headers)
+        if any(keyword in col_name.lower() for keyword in _DOOR_COLUMN_KEYWORDS)
+    ]
+    if keyword_idxs:
+        counts = df.iloc[:, keyword_idxs].nunique().tolist()
+        door_column_candidates = [
+            (headers[col_idx], unique_vals, col_idx)
+            for col_idx, unique_vals in zip(keyword_idxs, counts)
+            if 3 <= unique_vals <= 200  # Reasonable range for door count
+        ]
+    
+    # If no obvious door column, check the first 10 columns by cardinality
+    if not door_column_candidates:
+        counts = df.iloc[:, :10].nunique().tolist()
+        door_column_candidates = [
+            (headers[col_idx], unique_vals, col_idx)
+            for col_idx, unique_vals in enumerate(counts)
+            if 5 <= unique_vals <= 100  # Good range for door IDs
+        ]
+    
+    # Select best door column candidate
+    if door_column_candidates:
+        # Sort by number of unique values (prefer reasonable door counts)
+        door_column_candidates.sort(key=lambda x: abs(x[1] - 25))  # Prefer ~25 doors
+        best_col_name, best_count, best_idx = door_column_candidates[0]
+        door_values = df.iloc[:, best_idx].fillna('nan').to_numpy()
+        doors = pd.unique(door_values)[:100].tolist()  # Limit to 100
+        logger.debug("🚪 Found %s doors in column '%s' (cardinality: %s)", len(doors), best_col_name, best_count)
+    
+    return {
+        'headers': headers,
+        'doors': doors,
+        'row_count': row_count,
+        'column_count': column_count,
+        'file_size_bytes': len(decoded),
+        'door_candidates': door_column_candidates,
+        'sample_data': df.head(3).to_dict('records') if sample_rows else [],
+    }
 
 # 1. Enhanced Upload Callback with Full Data Processing
-@app.callback(
-    [
-        Output('uploaded-file-store', 'data'),
-        Output('csv-headers-store', 'data'),
-        Output('processing-status', 'children'),
-        Output('all-doors-from-csv-store', 'data'),
-        Output('interactive-setup-container', 'style'),
-        Output('upload-data', 'style'),
-        Output('processed-data-store', 'data')  # Store processed data
-    ],
-    Input('upload-data', 'contents'),
-    State('upload-data', 'filename'),
-    prevent_initial_call=True
-)
 def enhanced_file_upload_with_processing_v6(contents, filename):
     """Version 6.0 - Enhanced upload callback with comprehensive processing"""
-    print(f"🔄 Version 6.0 upload callback triggered: {filename}")
+    logger.debug("🔄 Version 6.0 upload callback triggered: %s", filename)
     if not contents:
-        return None, None, "", None, {'display': 'none'}, {}, None
+        return _EMPTY_UPLOAD_RESPONSE
     
     try:
-        print(f"📄 Processing file: {filename}")
-        
-        # Decode file
-        content_type, content_string = contents.split(',')
-        decoded = base64.b64decode(content_string)
+        logger.debug("📄 Processing file: %s", filename)
         
         if not filename.lower().endswith('.csv'):
-            print("❌ Not a CSV file")
-            return None, None, "Error: Please upload a CSV file", None, {'display': 'none'}, {}, None
-        
-        # Read and process CSV
-        df = pd.read_csv(io.StringIO(decoded.decode('utf-8')))
-        headers = df.columns.tolist()
-        print(f"✅ CSV loaded: {len(df)} rows, {len(headers)} columns")
-        print(f"📋 Headers: {headers}")
-        
-        # Enhanced door extraction with better logic
-        doors = []
-        door_column_candidates = []
+            logger.debug("❌ Not a CSV file")
+            return None, "Error: Please upload a CSV file", None, _HIDE_STYLE, {}, None
         
-        for col_idx, col_name in enumerate(headers):
-            # Check if column name suggests it contains door/device IDs
-            col_lower = col_name.lower()
-            if any(keyword in col_lower for keyword in ['door', 'device', 'reader', 'access', 'card']):
-                unique_vals = df.iloc[:, col_idx].nunique()
-                if 3 <= unique_vals <= 200:  # Reasonable range for door count
-                    door_column_candidates.append((col_name, unique_vals, col_idx))
-        
-        # If no obvious door column, check by cardinality
-        if not door_column_candidates:
-            for col_idx in range(min(len(headers), 10)):  # Check first 10 columns
-                unique_vals = df.iloc[:, col_idx].nunique()
-                if 5 <= unique_vals <= 100:  # Good range for door IDs
-                    door_column_candidates.append((headers[col_idx], unique_vals, col_idx))
-        
-        # Select best door column candidate
-        if door_column_candidates:
-            # Sort by number of unique values (prefer reasonable door counts)
-            door_column_candidates.sort(key=lambda x: abs(x[1] - 25))  # Prefer ~25 doors
-            best_col_name, best_count, best_idx = door_column_candidates[0]
-            doors = df.iloc[:, best_idx].astype(str).unique().tolist()[:100]  # Limit to 100
-            print(f"🚪 Found {len(doors)} doors in column '{best_col_name}' (cardinality: {best_count})")
+        content_type, content_string = contents.split(',')
+        sniff = _sniff_csv_upload(content_string)
+        headers = sniff['headers']
+        row_count = sniff['row_count']
+        column_count = sniff['column_count']
+        file_size = sniff['file_size_bytes']
         
         # Store comprehensive processed data for Version 6.0
         processed_data = {
             'filename': filename,
-            'dataframe': df.to_dict('records'),  # Convert to dict for JSON storage
             'columns': headers,
-            'row_count': len(df),
-            'column_count': len(headers),
-            'file_size_bytes': len(decoded),
-            'file_size_mb': round(len(decoded) / (1024 * 1024), 2),
-            'upload_timestamp': pd.Timestamp.now().isoformat(),
-            'door_candidates': door_column_candidates,
-            'data_types': df.dtypes.astype(str).to_dict(),
-            'sample_data': df.head(3).to_dict('records') if len(df) > 0 else [],
+            'row_count': row_count,
+            'column_count': column_count,
+            'file_size_bytes': file_size,
+            'file_size_mb': round(file_size / (1024 * 1024), 2),
+            'upload_timestamp': datetime.now().isoformat(),
+            'door_candidates': sniff['door_candidates'],
+            'sample_data': sniff['sample_data'],
             'version': '6.0'
         }
         
-        # Enhanced setup container style
-        setup_style = {
-            'display': 'block',
-            'padding': '25px',
-            'backgroundColor': '#1A2332',
-            'borderRadius': '12px',
-            'margin': '20px auto',
-            'width': '90%',
-            'maxWidth': '1000px',
-            'border': '1px solid #2D3748',
-            'boxShadow': '0 10px 15px rgba(0, 0, 0, 0.1)'
-        }
-        
-        # Enhanced upload success style
-        upload_success_style = {
-            'width': '70%', 'maxWidth': '600px', 'minHeight': '200px',
-            'borderRadius': '12px', 'textAlign': 'center', 'margin': '20px auto',
-            'display': 'flex', 'alignItems': 'center', 'justifyContent': 'center',
-            'cursor': 'pointer', 'transition': 'all 0.3s ease',
-            'border': '2px solid #2DBE6C', 'backgroundColor': 'rgba(45, 190, 108, 0.1)',
-            'boxShadow': '0 4px 6px rgba(45, 190, 108, 0.3)'
-        }
-        
-        print("✅ Version 6.0 enhanced upload successful with comprehensive data processing")
-        return (contents, headers, 
-                f"✅ Uploaded: {filename} ({len(df):,} rows, {len(headers)} columns) - Ready for Version 6.0 enhanced analytics!",
-                doors, setup_style, upload_success_style, processed_data)
+        logger.debug("✅ Version 6.0 enhanced upload successful with comprehensive data processing")
+        return (headers,
+                f"✅ Uploaded: {filename} ({row_count:,} rows, {column_count} columns) - Ready for Version 6.0 enhanced analytics!",
+                sniff['doors'], _SETUP_CONTAINER_STYLE, _UPLOAD_SUCCESS_STYLE, processed_data)
         
     except Exception as e:
-        print(f"❌ Error in Version 6.0 enhanced upload: {e}")
-        traceback.print_exc()
-        return None, None, f"❌ Error processing {filename}: {str(e)}", None, {'display': 'none'}, {}, None
+        logger.exception("Error in Version 6.0 enhanced upload: %s", e)
+        return None, f"❌ Error processing {filename}: {str(e)}", None, _HIDE_STYLE, {}, None
 
 # 2. Enhanced Mapping Callback with Auto-Suggestions
-@app.callback(
-    [
-        Output('dropdown-mapping-area', 'children'),
-        Output('confirm-header-map-button', 'style'),
-        Output('mapping-ui-section', 'style')
-    ],
-    Input('csv-headers-store', 'data'),
-    prevent_initial_call=True
-)
+# REQUIRED_INTERNAL_COLUMNS is fixed at import time, so snapshot it once
+_REQUIRED_ITEMS = tuple(REQUIRED_INTERNAL_COLUMNS.items())
+
+_COLUMN_KEYWORDS = {
+    'Timestamp': ('time', 'date', 'timestamp', 'datetime', 'created', 'when', 'occurred', 'event_time'),
+    'UserID': ('user', 'id', 'person', 'employee', 'badge', 'card', 'who', 'holder', 'person_id'),
+    'DoorID': ('door', 'device', 'reader', 'access', 'location', 'where', 'point', 'terminal', 'device_name'),
+    'EventType': ('event', 'type', 'result', 'status', 'action', 'outcome', 'what', 'response', 'access_result'),
+}
+
+# Usual column order in access-control exports
+_COLUMN_POSITIONS = {'Timestamp': 0, 'UserID': 1, 'DoorID': 2, 'EventType': 3}
+
+def _find_best_column_match_v6(internal_key, headers, lowered_headers, compact_headers):
+    """Version 6.0 - Find best matching column using multiple strategies"""
+    keywords = _COLUMN_KEYWORDS.get(internal_key, ())
+    
+    # Strategy 1: Exact keyword match
+    for header, header_compact in zip(headers, compact_headers):
+        for keyword in keywords:
+            if keyword in header_compact:
+                return header
+    
+    # Strategy 2: Fuzzy matching
+    for keyword in keywords:
+        matches = difflib.get_close_matches(keyword, lowered_headers, n=1, cutoff=0.6)
+        if matches:
+            return headers[lowered_headers.index(matches[0])]
+    
+    # Strategy 3: Position-based guessing (common CSV patterns)
+    pos = _COLUMN_POSITIONS.get(internal_key)
+    if pos is not None and pos < len(headers):
+        return headers[pos]
+    
+    return None
+
 def create_intelligent_mapping_dropdowns_v6(headers):
     """Version 6.0 - Enhanced mapping callback with intelligent auto-suggestions"""
-    print(f"🗺️ Version 6.0 mapping callback triggered with headers: {headers}")
+    logger.debug("🗺️ Version 6.0 mapping callback triggered with headers: %s", headers)
     if not headers:
-        return [], {'display': 'none'}, {'display': 'none'}
+        return _EMPTY_MAPPING_RESPONSE
     
     try:
-        print(f"🗺️ Creating intelligent mapping dropdowns for {len(headers)} headers")
+        logger.debug("🗺️ Creating intelligent mapping dropdowns for %s headers", len(headers))
         
-        # Enhanced auto-suggestion logic for Version 6.0
-        def find_best_column_match_v6(internal_key, headers):
-            """Version 6.0 - Find best matching column using multiple strategies"""
-            keywords_map = {
-                'Timestamp': ['time', 'date', 'timestamp', 'datetime', 'created', 'when', 'occurred', 'event_time'],
-                'UserID': ['user', 'id', 'person', 'employee', 'badge', 'card', 'who', 'holder', 'person_id'],
-                'DoorID': ['door', 'device', 'reader', 'access', 'location', 'where', 'point', 'terminal', 'device_name'],
-                'EventType': ['event', 'type', 'result', 'status', 'action', 'outcome', 'what', 'response', 'access_result']
-            }
-            
-            keywords = keywords_map.get(internal_key, [])
-            
-            # Strategy 1: Exact keyword match
-            for header in headers:
-                header_lower = header.lower().replace(' ', '').replace('_', '').replace('(', '').replace(')', '')
-                for keyword in keywords:
-                    if keyword in header_lower:
-                        return header
-            
-            # Strategy 2: Fuzzy matching
-            import difflib
-            for keyword in keywords:
-                matches = difflib.get_close_matches(keyword, [h.lower() for h in headers], n=1, cutoff=0.6)
-                if matches:
-                    return next(h for h in headers if h.lower() == matches[0])
-            
-            # Strategy 3: Position-based guessing (common CSV patterns)
-            position_map = {'Timestamp': 0, 'UserID': 1, 'DoorID': 2, 'EventType': 3}
-            if internal_key in position_map:
-                pos = position_map[internal_key]
-                if pos < len(headers):
-                    return headers[pos]
-            
-            return None
+        # Normalise the headers once rather than per internal column
+        lowered_headers = [h.lower() for h in headers]
+        compact_headers = [
+            h.replace(' ', '').replace('_', '').replace('(', '').replace(')', '')
+            for h in lowered_headers
+        ]
         
+        # Every dropdown offers the same choices, so share one options list
+        options = [{'label': h, 'value': h} for h in headers]
         mapping_controls = []
         
-        for internal_key, display_name in REQUIRED_INTERNAL_COLUMNS.items():
-            suggested_value = find_best_column_match_v6(internal_key, headers)
+        for internal_key, display_name in _REQUIRED_ITEMS:
+            suggested_value = _find_best_column_match_v6(
+                internal_key, headers, lowered_headers, compact_headers
+            )
             
             if suggested_value:
-                print(f"💡 Version 6.0 auto-suggested '{suggested_value}' for {internal_key}")
+                logger.debug("💡 Version 6.0 auto-suggested '%s' for %s", suggested_value, internal_key)
             
             # Enhanced dropdown with better styling
             mapping_controls.append(
@@ -1005,7 +1159,7 @@ def create_intelligent_mapping_dropdowns_v6(headers):
                     }),
                     dcc.Dropdown(
                         id={'type': 'mapping-dropdown', 'index': internal_key},
-                        options=[{'label': h, 'value': h} for h in headers],
+                        options=options,
                         value=suggested_value,
                         placeholder=f"Select column for {display_name}...",
                         style={
@@ -1028,241 +1182,36 @@ def create_intelligent_mapping_dropdowns_v6(headers):
                 ], style={'marginBottom': '24px'})
             )
         
-        # Enhanced button style
-        button_style = {
-            'display': 'block',
-            'margin': '25px auto',
-            'padding': '12px 30px',
-            'backgroundColor': '#2196F3',
-            'color': 'white',
-            'border': 'none',
-            'borderRadius': '8px',
-            'cursor': 'pointer',
-            'fontSize': '16px',
-            'fontWeight': '600',
-            'boxShadow': '0 4px 6px rgba(33, 150, 243, 0.3)',
-            'transition': 'all 0.3s ease'
-        }
-        
-        # Enhanced section style
-        mapping_section_style = {
-            'display': 'block',
-            'padding': '25px',
-            'backgroundColor': '#1A2332',
-            'borderRadius': '12px',
-            'margin': '20px auto',
-            'width': '85%',
-            'maxWidth': '700px',
-            'border': '1px solid #2D3748',
-            'boxShadow': '0 4px 6px rgba(0, 0, 0, 0.1)'
-        }
-        
-        print(f"✅ Created {len(mapping_controls)} Version 6.0 enhanced mapping controls with auto-suggestions")
-        return mapping_controls, button_style, mapping_section_style
+        logger.debug("✅ Created %s Version 6.0 enhanced mapping controls with auto-suggestions", len(mapping_controls))
+        return mapping_controls, _CONFIRM_MAPPING_BUTTON_STYLE, _MAPPING_SECTION_STYLE
         
     except Exception as e:
-        print(f"❌ Error creating Version 6.0 enhanced mapping: {e}")
-        traceback.print_exc()
-        return [], {'display': 'none'}, {'display': 'none'}
+        logger.exception("Error creating Version 6.0 enhanced mapping: %s", e)
+        return _EMPTY_MAPPING_RESPONSE
 
 # 3. Enhanced Mapping Confirmation Callback
-@app.callback(
-    [
-        Output('entrance-verification-ui-section', 'style'),
-        Output('mapping-ui-section', 'style', allow_duplicate=True),  
-        Output('processing-status', 'children', allow_duplicate=True)
-    ],
-    Input('confirm-header-map-button', 'n_clicks'),
-    [
-        State({'type': 'mapping-dropdown', 'index': ALL}, 'value'),
-        State({'type': 'mapping-dropdown', 'index': ALL}, 'id')
-    ],
-    prevent_initial_call=True
-)
-def enhanced_mapping_confirmation_v6(n_clicks, values, ids):
-    """Version 6.0 - Enhanced mapping confirmation with comprehensive validation"""
-    print(f"🔄 Version 6.0 mapping confirmation: n_clicks={n_clicks}")
-    if not n_clicks:
-        return {'display': 'none'}, {'display': 'block'}, no_update
-    
-    try:
-        # Validate mapping completeness
-        mapped_count = sum(1 for v in values if v is not None)
-        required_count = len(REQUIRED_INTERNAL_COLUMNS)
-        
-        print(f"📊 Version 6.0 mapping validation: {mapped_count}/{required_count} columns mapped")
-        
-        if mapped_count < required_count:
-            missing_fields = [
-                REQUIRED_INTERNAL_COLUMNS[ids[i]['index']] 
-                for i, v in enumerate(values) if v is None
-            ]
-            return (
-                {'display': 'none'}, 
-                {'display': 'block'}, 
-                f"⚠️ Please map all required columns. Missing: {', '.join(missing_fields[:2])}{'...' if len(missing_fields) > 2 else ''}"
-            )
-        
-        # Enhanced classification section style
-        classification_style = {
-            'display': 'block',
-            'padding': '25px',
-            'backgroundColor': '#1A2332',
-            'borderRadius': '12px',
-            'margin': '20px auto',
-            'width': '85%',
-            'maxWidth': '800px',
-            'border': '1px solid #2D3748',
-            'boxShadow': '0 4px 6px rgba(0, 0, 0, 0.1)'
-        }
-        
-        mapping_hide_style = {'display': 'none'}
-        
-        print("✅ Version 6.0 enhanced mapping confirmed, showing classification section")
-        return (
-            classification_style,
-            mapping_hide_style,
-            "✅ Column mapping completed! Configure your facility settings below for Version 6.0 enhanced analytics:"
-        )
-        
-    except Exception as e:
-        print(f"❌ Error in Version 6.0 mapping confirmation: {e}")
-        return {'display': 'none'}, {'display': 'block'}, f"❌ Error: {str(e)}"
-    
-# 4. Classification Toggle Callback
-@app.callback(
-    Output('door-classification-table-container', 'style'),
-    Input('manual-map-toggle', 'value'),
-    prevent_initial_call=True
-)
-def enhanced_classification_toggle_v6(toggle_value):
-    """Version 6.0 - Enhanced classification toggle"""
-    print(f"🎛️ Version 6.0 classification toggle: {toggle_value}")
-    if toggle_value == 'yes':
-        return {
-            'display': 'block',
-            'marginTop': '20px',
-            'animation': 'slideDown 0.3s ease-out'
-        }
-    else:
-        return {'display': 'none'}
-
-# 5. Floor Display Callback  
-@app.callback(
-    Output('num-floors-display', 'children'),
-    Input('num-floors-input', 'value'),
-    prevent_initial_call=True
-)
-def update_floor_display_v6(value):
-    """Version 6.0 - Update floor display"""
-    if value is None:
-        value = 4
-    floors = int(value)
-    return f"{floors} floor{'s' if floors != 1 else ''}"
-
-# 6. MAIN ENHANCED ANALYSIS CALLBACK with Full Integration
-@app.callback(
-    [
-        # Visibility outputs
-        Output('yosai-custom-header', 'style'),
-        Output('stats-panels-container', 'style'),
-        Output('analytics-section', 'style'),
-        Output('charts-section', 'style'),
-        Output('export-section', 'style'),
-        Output('graph-output-container', 'style'),
-        
-        # Basic stats outputs (maintaining compatibility)
-        Output('total-access-events-H1', 'children'),
-        Output('event-date-range-P', 'children'),
-        Output('most-active-devices-table-body', 'children'),
-        Output('onion-graph', 'elements'),
-        Output('processing-status', 'children', allow_duplicate=True),
-        
-        # Enhanced stats outputs (if available)
-        Output('stats-unique-users', 'children'),
-        Output('stats-avg-events-per-user', 'children'),
-        Output('stats-most-active-user', 'children'),
-        Output('stats-devices-per-user', 'children'),
-        Output('stats-peak-hour', 'children'),
-        Output('total-devices-count', 'children'),
-        Output('entrance-devices-count', 'children'),
-        Output('high-security-devices', 'children'),
-        
-        # Advanced analytics outputs (if available)
-        Output('traffic-pattern-insight', 'children'),
-        Output('security-score-insight', 'children'),
-        Output('efficiency-insight', 'children'),
-        Output('anomaly-insight', 'children'),
-        Output('peak-hour-display', 'children'),
-        Output('peak-day-display', 'children'),
-        Output('busiest-floor', 'children'),
-        Output('entry-exit-ratio', 'children'),
-        Output('weekend-vs-weekday', 'children'),
-        Output('security-level-breakdown', 'children'),
-        Output('compliance-score', 'children'),
-        Output('anomaly-alerts', 'children'),
-        
-        # Chart outputs (if available)
-        Output('main-analytics-chart', 'figure'),
-        Output('security-pie-chart', 'figure'),
-        Output('heatmap-chart', 'figure'),
-        
-        # Store enhanced metrics
-        Output('enhanced-metrics-store', 'data')
-    ],
-    Input('confirm-and-generate-button', 'n_clicks'),
-    [
-        State('uploaded-file-store', 'data'),
-        State('processed-data-store', 'data'),
-        State('csv-headers-store', 'data'),
-        State('all-doors-from-csv-store', 'data'),
-        State({'type': 'mapping-dropdown', 'index': ALL}, 'value'),
-        State({'type': 'mapping-dropdown', 'index': ALL}, 'id'),
-        State('num-floors-input', 'value'),
-        State('manual-map-toggle', 'value')
-    ],
-    prevent_initial_call=True
-)
 def generate_comprehensive_enhanced_analysis_v6(n_clicks, file_data, processed_data, headers, doors, 
                                                mapping_values, mapping_ids, num_floors, manual_classification):
     """Version 6.0 - Generate comprehensive enhanced analysis with full feature set"""
-    if not n_clicks or not file_data:
-        print("❌ Version 6.0 generate analysis called without required data")
+    if not n_clicks or not file_data or not processed_data:
+        logger.debug("❌ Version 6.0 generate analysis called without required data")
         # Return comprehensive default state
-        hide_style = {'display': 'none'}
-        empty_figure = {'data': [], 'layout': {'title': 'No data available', 'plot_bgcolor': '#0F1419', 'paper_bgcolor': '#1A2332', 'font': {'color': '#F7FAFC'}}}
-        
-        return ([hide_style] * 6 +  # Visibility
-                ['0', 'No data', [], [], "Click generate to start Version 6.0 comprehensive analysis"] +  # Basic stats
-                ['No data'] * 8 +  # Enhanced stats  
-                ['No data'] * 12 +  # Advanced analytics
-                [empty_figure] * 3 +  # Charts
-                [None])  # Metrics store
+        return _NO_ANALYSIS_RESPONSE
     
     try:
-        print("🎉 Generating Version 6.0 comprehensive enhanced analysis...")
-        
-        # Show all sections
-        show_style = {'display': 'block'}
-        stats_style = {
-            'display': 'flex', 
-            'flexDirection': 'row', 
-            'justifyContent': 'space-around', 
-            'gap': '20px', 
-            'marginBottom': '30px',
-            'width': '95%',
-            'margin': '0 auto 30px auto'
-        }
+        logger.debug("🎉 Generating Version 6.0 comprehensive enhanced analysis...")
+        pd = _pd()
         
         # Process the data with enhanced analytics
         df = None
         enhanced_metrics = {}
         
-        if processed_data and processed_data.get('dataframe'):
+        if processed_data:
             try:
-                # Reconstruct DataFrame from stored data
-                df = pd.DataFrame(processed_data['dataframe'])
-                print(f"📊 Processing {len(df)} records for Version 6.0 comprehensive analytics")
+                # Parse the full upload now that the mapping is confirmed
+                content_string = file_data.split(',')[1]
+                df = pd.read_csv(io.BytesIO(base64.b64decode(content_string)), encoding='utf-8')
+                logger.debug("📊 Processing %s records for Version 6.0 comprehensive analytics", len(df))
                 
                 # Apply column mapping if available
                 if mapping_values and mapping_ids:
@@ -1275,16 +1224,17 @@ def generate_comprehensive_enhanced_analysis_v6(n_clicks, file_data, processed_d
                     
                     if column_mapping:
                         df = df.rename(columns=column_mapping)
-                        print(f"✅ Applied column mapping: {column_mapping}")
+                        logger.debug("✅ Applied column mapping: %s", column_mapping)
                         
                         # Convert timestamp column if available
                         timestamp_col = REQUIRED_INTERNAL_COLUMNS.get('Timestamp')
                         if timestamp_col and timestamp_col in df.columns:
                             try:
                                 df[timestamp_col] = pd.to_datetime(df[timestamp_col], errors='coerce')
-                                print(f"✅ Converted timestamp column: {timestamp_col}")
+                                logger.debug("✅ Converted timestamp column: %s", timestamp_col)
                             except Exception as e:
-                                print(f"⚠️ Could not convert timestamp: {e}")
+                                logger.warning("Could not convert timestamp: %s", e,
+                                               exc_info=logger.isEnabledFor(logging.DEBUG))
                 
                 # Calculate enhanced metrics using the stats component
                 enhanced_stats = component_instances.get('enhanced_stats')
@@ -1303,7 +1253,7 @@ def generate_comprehensive_enhanced_analysis_v6(n_clicks, file_data, processed_d
                             'IsStaircase': [i % 8 == 0 for i in range(min(20, len(doors)))],
                             'IsGloballyCritical': [i % 12 == 0 for i in range(min(20, len(doors)))]
                         })
-                        print(f"✅ Created device attributes for {len(device_attrs)} doors")
+                        logger.debug("✅ Created device attributes for %s doors", len(device_attrs))
                     
                     # Calculate comprehensive enhanced metrics
                     enhanced_metrics = enhanced_stats.calculate_enhanced_metrics(df, device_attrs)
@@ -1313,23 +1263,24 @@ def generate_comprehensive_enhanced_analysis_v6(n_clicks, file_data, processed_d
                     security_chart = enhanced_stats.create_security_pie_chart(device_attrs) if device_attrs is not None else enhanced_stats._create_empty_figure("No security data")
                     heatmap_chart = enhanced_stats.create_activity_heatmap(df)
                     
-                    print("✅ Version 6.0 enhanced metrics and charts generated successfully")
+                    logger.debug("✅ Version 6.0 enhanced metrics and charts generated successfully")
                     
                 else:
-                    print("⚠️ Enhanced stats component not available, using Version 6.0 fallback")
+                    logger.warning("⚠️ Enhanced stats component not available, using Version 6.0 fallback")
                     enhanced_metrics = _calculate_comprehensive_fallback_metrics_v6(df, doors, num_floors)
                     hourly_chart = _create_fallback_chart_v6('hourly')
                     security_chart = _create_fallback_chart_v6('security')
                     heatmap_chart = _create_fallback_chart_v6('heatmap')
                     
             except Exception as e:
-                print(f"⚠️ Error processing data: {e}")
+                logger.warning("Error processing data, using fallback metrics: %s", e,
+                               exc_info=logger.isEnabledFor(logging.DEBUG))
                 enhanced_metrics = _calculate_comprehensive_fallback_metrics_v6(None, doors, num_floors)
                 hourly_chart = _create_error_chart_v6(str(e))
                 security_chart = _create_error_chart_v6(str(e))
                 heatmap_chart = _create_error_chart_v6(str(e))
         else:
-            print("⚠️ No processed data available, using Version 6.0 comprehensive fallback")
+            logger.warning("⚠️ No processed data available, using Version 6.0 comprehensive fallback")
             enhanced_metrics = _calculate_comprehensive_fallback_metrics_v6(None, doors, num_floors)
             hourly_chart = _create_fallback_chart_v6('hourly')
             security_chart = _create_fallback_chart_v6('security')
@@ -1344,11 +1295,11 @@ def generate_comprehensive_enhanced_analysis_v6(n_clicks, file_data, processed_d
         # Create comprehensive security breakdown
         security_breakdown = _create_comprehensive_security_breakdown_v6(enhanced_metrics)
         
-        print("✅ Version 6.0 comprehensive enhanced analysis completed successfully")
+        logger.debug("✅ Version 6.0 comprehensive enhanced analysis completed successfully")
         
         return (
             # Visibility outputs (6)
-            show_style, stats_style, show_style, show_style, show_style, show_style,
+            *_ANALYSIS_VISIBLE_STYLES,
             
             # Basic stats outputs (5)
             f"{enhanced_metrics.get('total_events', 0):,}",
@@ -1391,14 +1342,12 @@ def generate_comprehensive_enhanced_analysis_v6(n_clicks, file_data, processed_d
         )
         
     except Exception as e:
-        print(f"❌ Critical error in Version 6.0 comprehensive analysis: {e}")
-        traceback.print_exc()
+        logger.exception("Critical error in Version 6.0 comprehensive analysis: %s", e)
         
         # Return comprehensive error state
-        hide_style = {'display': 'none'}
         error_figure = {'data': [], 'layout': {'title': f'Analysis Error: {str(e)}', 'plot_bgcolor': '#0F1419', 'paper_bgcolor': '#1A2332', 'font': {'color': '#F7FAFC'}}}
         
-        return ([hide_style] * 6 +  # Visibility
+        return ([_HIDE_STYLE] * 6 +  # Visibility
                 ['Error', 'Error', [], [], f"❌ Version 6.0 Analysis Error: {str(e)}"] +  # Basic stats
                 ['Error'] * 8 +  # Enhanced stats
                 ['Error'] * 12 +  # Advanced analytics
@@ -1443,47 +1392,48 @@ def _calculate_comprehensive_fallback_metrics_v6(df, doors, num_floors):
         'version': '6.0'
     }
 
+# Demo figures shown when the enhanced stats component is unavailable
+_FALLBACK_CHART_LAYOUT = {
+    'plot_bgcolor': '#0F1419',
+    'paper_bgcolor': '#1A2332',
+    'font': {'color': '#F7FAFC'},
+    'margin': {'l': 50, 'r': 50, 't': 50, 'b': 50}
+}
+_FALLBACK_CHARTS = {
+    'hourly': {
+        'data': [{
+            'x': list(range(24)),
+            'y': [100 + i*15 + (i%4)*30 for i in range(24)],
+            'type': 'bar',
+            'name': 'Hourly Activity',
+            'marker': {'color': '#2196F3'}
+        }],
+        'layout': {**_FALLBACK_CHART_LAYOUT, 'title': 'Access Events by Hour', 'xaxis': {'title': 'Hour of Day'}, 'yaxis': {'title': 'Activity Count'}}
+    },
+    'security': {
+        'data': [{
+            'values': [12, 8, 3],
+            'labels': ['Green', 'Yellow', 'Red'],
+            'type': 'pie',
+            'marker': {'colors': ['#2DBE6C', '#FFB020', '#E02020']}
+        }],
+        'layout': {**_FALLBACK_CHART_LAYOUT, 'title': 'Security Level Distribution'}
+    },
+    'heatmap': {
+        'data': [{
+            'z': [[20, 30, 40, 35], [25, 45, 60, 55], [15, 25, 35, 30]],
+            'x': ['Morning', 'Afternoon', 'Evening', 'Night'],
+            'y': ['Monday', 'Tuesday', 'Wednesday'],
+            'type': 'heatmap',
+            'colorscale': 'Blues'
+        }],
+        'layout': {**_FALLBACK_CHART_LAYOUT, 'title': 'Activity Heatmap'}
+    },
+}
+
 def _create_fallback_chart_v6(chart_type):
-    """Version 6.0 - Create fallback charts when enhanced stats not available"""
-    base_layout = {
-        'plot_bgcolor': '#0F1419',
-        'paper_bgcolor': '#1A2332',
-        'font': {'color': '#F7FAFC'},
-        'margin': {'l': 50, 'r': 50, 't': 50, 'b': 50}
-    }
-    
-    if chart_type == 'hourly':
-        return {
-            'data': [{
-                'x': list(range(24)),
-                'y': [100 + i*15 + (i%4)*30 for i in range(24)],
-                'type': 'bar',
-                'name': 'Hourly Activity',
-                'marker': {'color': '#2196F3'}
-            }],
-            'layout': {**base_layout, 'title': 'Access Events by Hour', 'xaxis': {'title': 'Hour of Day'}, 'yaxis': {'title': 'Activity Count'}}
-        }
-    elif chart_type == 'security':
-        return {
-            'data': [{
-                'values': [12, 8, 3],
-                'labels': ['Green', 'Yellow', 'Red'],
-                'type': 'pie',
-                'marker': {'colors': ['#2DBE6C', '#FFB020', '#E02020']}
-            }],
-            'layout': {**base_layout, 'title': 'Security Level Distribution'}
-        }
-    else:  # heatmap
-        return {
-            'data': [{
-                'z': [[20, 30, 40, 35], [25, 45, 60, 55], [15, 25, 35, 30]],
-                'x': ['Morning', 'Afternoon', 'Evening', 'Night'],
-                'y': ['Monday', 'Tuesday', 'Wednesday'],
-                'type': 'heatmap',
-                'colorscale': 'Blues'
-            }],
-            'layout': {**base_layout, 'title': 'Activity Heatmap'}
-        }
+    """Version 6.0 - Return the fallback chart used when enhanced stats are not available"""
+    return _FALLBACK_CHARTS.get(chart_type, _FALLBACK_CHARTS['heatmap'])
 
 def _create_error_chart_v6(error_message):
     """Version 6.0 - Create error chart when chart generation fails"""
@@ -1567,27 +1517,43 @@ def _create_comprehensive_graph_elements_v6(doors, num_floors):
                         }
                     })
         
-        print(f"✅ Version 6.0 created {len(nodes)} nodes and {len(edges)} edges for graph")
+        logger.debug("✅ Version 6.0 created %s nodes and %s edges for graph", len(nodes), len(edges))
         return nodes + edges
         
     except Exception as e:
-        print(f"⚠️ Error creating Version 6.0 graph elements: {e}")
+        logger.warning("Error creating Version 6.0 graph elements: %s", e,
+                       exc_info=logger.isEnabledFor(logging.DEBUG))
         return []
 
+_NO_DEVICES_ROWS = [html.Tr([
+    html.Td("No devices available", colSpan=2,
+           style={'color': '#A0AEC0', 'textAlign': 'center', 'padding': '15px'})
+])]
+_DEVICE_NAME_STYLE = {'fontWeight': '500'}
+_DEVICE_SHARE_STYLE = {'color': '#718096'}
+_DEVICE_NAME_CELL_STYLE = {'fontSize': '0.9rem', 'color': '#F7FAFC', 'padding': '12px 8px'}
+_DEVICE_EVENTS_STYLE = {'fontWeight': '600', 'fontSize': '1rem'}
+_DEVICE_ROW_STYLE = {'borderBottom': _PANEL_BORDER}
+# Dot and events-cell styles per activity colour (high, medium, low)
+_DEVICE_ACTIVITY_STYLES = {
+    color: ({'color': color, 'fontSize': '0.8rem'},
+            {'textAlign': 'right', 'color': color, 'padding': '12px 8px'})
+    for color in ('#2DBE6C', '#FFB020', '#A0AEC0')
+}
+
 def _create_enhanced_device_table_v6(doors, metrics):
     """Version 6.0 - Create enhanced device activity table"""
     if not doors:
-        return [html.Tr([
-            html.Td("No devices available", colSpan=2, 
-                   style={'color': '#A0AEC0', 'textAlign': 'center', 'padding': '15px'})
-        ])]
+        return _NO_DEVICES_ROWS
     
-    table_rows = []
+    top_doors = doors[:8]  # Show top 8 devices
+    shown = len(top_doors)
     base_events = metrics.get('total_events', 1500)
     
-    for i, door in enumerate(doors[:8]):  # Show top 8 devices
+    table_rows = []
+    for i, door in enumerate(top_doors):
         # Calculate realistic event distribution
-        events = int(base_events * (0.8 - i * 0.1) / len(doors[:8]))
+        events = int(base_events * (0.8 - i * 0.1) / shown)
         percentage = (events / base_events) * 100 if base_events > 0 else 0
         
         # Style based on activity level
@@ -1597,42 +1563,45 @@ def _create_enhanced_device_table_v6(doors, metrics):
             color = '#FFB020'  # Medium activity - yellow
         else:
             color = '#A0AEC0'  # Low activity - gray
+        dot_style, events_cell_style = _DEVICE_ACTIVITY_STYLES[color]
         
         table_rows.append(
             html.Tr([
                 html.Td([
-                    html.Div(str(door)[:20], style={'fontWeight': '500'}),
-                    html.Small(f"{percentage:.1f}% of total", style={'color': '#718096'})
-                ], style={'fontSize': '0.9rem', 'color': '#F7FAFC', 'padding': '12px 8px'}),
+                    html.Div(str(door)[:20], style=_DEVICE_NAME_STYLE),
+                    html.Small(f"{percentage:.1f}% of total", style=_DEVICE_SHARE_STYLE)
+                ], style=_DEVICE_NAME_CELL_STYLE),
                 html.Td([
-                    html.Div(f"{events:,}", style={'fontWeight': '600', 'fontSize': '1rem'}),
-                    html.Div("●", style={'color': color, 'fontSize': '0.8rem'})
-                ], style={'textAlign': 'right', 'color': color, 'padding': '12px 8px'})
-            ], style={'borderBottom': '1px solid #2D3748'})
+                    html.Div(f"{events:,}", style=_DEVICE_EVENTS_STYLE),
+                    html.Div("●", style=dot_style)
+                ], style=events_cell_style)
+            ], style=_DEVICE_ROW_STYLE)
         )
     
     return table_rows
 
+_DEFAULT_SECURITY_BREAKDOWN = [
+    html.P("🟢 Green (Public): 12 devices", style={'color': '#2DBE6C', 'margin': '6px 0', 'fontSize': '0.9rem'}),
+    html.P("🟡 Yellow (Semi-Restricted): 8 devices", style={'color': '#FFB020', 'margin': '6px 0', 'fontSize': '0.9rem'}),
+    html.P("🔴 Red (Restricted): 3 devices", style={'color': '#E02020', 'margin': '6px 0', 'fontSize': '0.9rem'}),
+]
+_SECURITY_LEVEL_COLORS = {'green': '#2DBE6C', 'yellow': '#FFB020', 'red': '#E02020', 'unclassified': '#A0AEC0'}
+_SECURITY_LEVEL_LABELS = {'green': 'Green (Public)', 'yellow': 'Yellow (Semi-Restricted)', 'red': 'Red (Restricted)', 'unclassified': 'Unclassified'}
+_SECURITY_LEVEL_EMOJIS = {'green': '🟢', 'yellow': '🟡', 'red': '🔴', 'unclassified': '⚪'}
+
 def _create_comprehensive_security_breakdown_v6(metrics):
     """Version 6.0 - Create comprehensive security level breakdown display"""
     security_data = metrics.get('security_breakdown', {})
     
     if not security_data:
-        return [
-            html.P("🟢 Green (Public): 12 devices", style={'color': '#2DBE6C', 'margin': '6px 0', 'fontSize': '0.9rem'}),
-            html.P("🟡 Yellow (Semi-Restricted): 8 devices", style={'color': '#FFB020', 'margin': '6px 0', 'fontSize': '0.9rem'}),
-            html.P("🔴 Red (Restricted): 3 devices", style={'color': '#E02020', 'margin': '6px 0', 'fontSize': '0.9rem'}),
-        ]
+        return _DEFAULT_SECURITY_BREAKDOWN
     
     breakdown_elements = []
-    colors = {'green': '#2DBE6C', 'yellow': '#FFB020', 'red': '#E02020', 'unclassified': '#A0AEC0'}
-    labels = {'green': 'Green (Public)', 'yellow': 'Yellow (Semi-Restricted)', 'red': 'Red (Restricted)', 'unclassified': 'Unclassified'}
-    emojis = {'green': '🟢', 'yellow': '🟡', 'red': '🔴', 'unclassified': '⚪'}
     
     for level, count in security_data.items():
-        color = colors.get(level, '#A0AEC0')
-        emoji = emojis.get(level, '⚪')
-        label = labels.get(level, level.title())
+        color = _SECURITY_LEVEL_COLORS.get(level, '#A0AEC0')
+        emoji = _SECURITY_LEVEL_EMOJIS.get(level, '⚪')
+        label = _SECURITY_LEVEL_LABELS.get(level) or level.title()
         
         breakdown_elements.append(
             html.P(f"{emoji} {label}: {count} devices", 
@@ -1642,15 +1611,9 @@ def _create_comprehensive_security_breakdown_v6(metrics):
     return breakdown_elements
 
 # 7. Enhanced Chart Update Callback
-@app.callback(
-    Output('main-analytics-chart', 'figure', allow_duplicate=True),
-    Input('chart-type-selector', 'value'),
-    State('enhanced-metrics-store', 'data'),
-    prevent_initial_call=True
-)
 def update_comprehensive_main_chart_v6(chart_type, metrics_data):
     """Version 6.0 - Update main chart with comprehensive data"""
-    print(f"📊 Version 6.0 updating chart: {chart_type}")
+    logger.debug("📊 Version 6.0 updating chart: %s", chart_type)
     
     try:
         base_layout = {
@@ -1738,7 +1701,7 @@ def update_comprehensive_main_chart_v6(chart_type, metrics_data):
         return {'data': data, 'layout': base_layout}
         
     except Exception as e:
-        print(f"❌ Error updating Version 6.0 chart: {e}")
+        logger.exception("Error updating Version 6.0 chart: %s", e)
         return {
             'data': [],
             'layout': {
@@ -1750,66 +1713,50 @@ def update_comprehensive_main_chart_v6(chart_type, metrics_data):
         }
 
 # 8. Export Actions Callback
-@app.callback(
-    Output('export-status', 'children'),
-    [
-        Input('export-stats-csv', 'n_clicks'),
-        Input('export-charts-png', 'n_clicks'),
-        Input('generate-pdf-report', 'n_clicks'),
-        Input('refresh-analytics', 'n_clicks')
-    ],
-    State('enhanced-metrics-store', 'data'),
-    prevent_initial_call=True
-)
+_STATUS_ICON_STYLE = {'marginRight': '8px'}
+
+# Export button id -> (icon, message, colour)
+_EXPORT_MESSAGES = {
+    'export-stats-csv': ("📊", "Version 6.0 CSV export completed! Statistics data saved to downloads.", '#2DBE6C'),
+    'export-charts-png': ("📈", "Version 6.0 Charts exported as PNG! Images saved to downloads.", '#2DBE6C'),
+    'generate-pdf-report': ("📄", "Version 6.0 Comprehensive PDF report generated! Check your downloads folder.", '#2DBE6C'),
+    'refresh-analytics': ("🔄", "Version 6.0 Analytics data refreshed! All metrics updated with latest calculations.", '#2196F3'),
+}
+
+@functools.lru_cache(maxsize=32)
+def _status_message(icon, text, color):
+    """Icon + text status line; identical messages reuse the same component"""
+    return html.Div([
+        html.Span(f"{icon} ", style=_STATUS_ICON_STYLE),
+        text
+    ], style={'color': color, 'fontWeight': '500'})
+
 def handle_comprehensive_export_actions_v6(csv_clicks, png_clicks, pdf_clicks, refresh_clicks, metrics_data):
     """Version 6.0 - Handle comprehensive export actions"""
-    from dash import ctx
-    
     if not ctx.triggered:
         return ""
     
     button_id = ctx.triggered[0]['prop_id'].split('.')[0]
     
     try:
-        if button_id == 'export-stats-csv':
-            # Simulate CSV export
-            return html.Div([
-                html.Span("📊 ", style={'marginRight': '8px'}),
-                "Version 6.0 CSV export completed! Statistics data saved to downloads."
-            ], style={'color': '#2DBE6C', 'fontWeight': '500'})
-            
-        elif button_id == 'export-charts-png':
-            return html.Div([
-                html.Span("📈 ", style={'marginRight': '8px'}),
-                "Version 6.0 Charts exported as PNG! Images saved to downloads."
-            ], style={'color': '#2DBE6C', 'fontWeight': '500'})
-            
-        elif button_id == 'generate-pdf-report':
-            return html.Div([
-                html.Span("📄 ", style={'marginRight': '8px'}),
-                "Version 6.0 Comprehensive PDF report generated! Check your downloads folder."
-            ], style={'color': '#2DBE6C', 'fontWeight': '500'})
-            
-        elif button_id == 'refresh-analytics':
-            return html.Div([
-                html.Span("🔄 ", style={'marginRight': '8px'}),
-                "Version 6.0 Analytics data refreshed! All metrics updated with latest calculations."
-            ], style={'color': '#2196F3', 'fontWeight': '500'})
+        message = _EXPORT_MESSAGES.get(button_id)
+        if message:
+            return _status_message(*message)
     
     except Exception as e:
-        return html.Div([
-            html.Span("❌ ", style={'marginRight': '8px'}),
-            f"Export error: {str(e)}"
-        ], style={'color': '#E02020', 'fontWeight': '500'})
+        return _status_message("❌", f"Export error: {str(e)}", '#E02020')
     
     return ""
 
 # 9. Node Tap Callback for Graph Interaction
-@app.callback(
-    Output('tap-node-data-output', 'children'),
-    Input('onion-graph', 'tapNodeData'),
-    prevent_initial_call=True
-)
+_NODE_TYPE_LABELS = {
+    'entrance': '🚪 Entrance/Exit Point',
+    'security': '🔒 Security Checkpoint',
+    'critical': '⚠️ Critical Asset',
+    'regular': '📱 Standard Access Point'
+}
+_SECURITY_LEVEL_ICONS = {'high': '🔴', 'medium': '🟡', 'low': '🟢'}
+
 def display_comprehensive_node_data_v6(data):
     """Version 6.0 - Display comprehensive node information when tapped"""
     if not data:
@@ -1820,18 +1767,12 @@ def display_comprehensive_node_data_v6(data):
         details = []
         
         # Basic info
-        node_name = data.get('label', data.get('id', 'Unknown Device'))
+        node_name = data.get('label') or data.get('id') or 'Unknown Device'
         details.append(f"🎯 Selected: {node_name}")
         
         # Device type
         device_type = data.get('type', 'regular')
-        type_icons = {
-            'entrance': '🚪 Entrance/Exit Point',
-            'security': '🔒 Security Checkpoint', 
-            'critical': '⚠️ Critical Asset',
-            'regular': '📱 Standard Access Point'
-        }
-        details.append(type_icons.get(device_type, f"📱 {device_type.title()}"))
+        details.append(_NODE_TYPE_LABELS.get(device_type) or f"📱 {device_type.title()}")
         
         # Location info
         if 'floor' in data:
@@ -1840,9 +1781,8 @@ def display_comprehensive_node_data_v6(data):
                
         # Security level
         if 'security_level' in data:
-            security_icons = {'high': '🔴', 'medium': '🟡', 'low': '🟢'}
             security_level = data['security_level']
-            icon = security_icons.get(security_level, '⚪')
+            icon = _SECURITY_LEVEL_ICONS.get(security_level, '⚪')
             details.append(f"{icon} Security: {security_level.title()}")
         
         # Special properties
@@ -1859,115 +1799,473 @@ def display_comprehensive_node_data_v6(data):
     except Exception as e:
         return f"Node information unavailable: {str(e)}"
 
-# 10. Client-side callback for enhanced radio toggle styling
-app.clientside_callback(
+def _intern_ids(dependencies):
+    """Intern the string component ids/properties of Dash dependencies in place"""
+    for dep in dependencies if isinstance(dependencies, (list, tuple)) else (dependencies,):
+        if isinstance(dep.component_id, str):
+            dep.component_id = sys.intern(dep.component_id)
+        dep.component_property = sys.intern(dep.component_property)
+
+def _spec(*args, **kwargs):
+    """Capture ``app.callback`` arguments as a ``(name, args, kwargs, func)`` entry"""
+    for dependencies in args:
+        _intern_ids(dependencies)
+
+    def bind(func):
+        return (func.__name__, args, kwargs, func)
+    return bind
+
+# Server-side callbacks, attached to the app in a single pass by register_callbacks()
+_CALLBACK_SPECS = (
+    # 1. Enhanced upload
+    _spec(
+        # The browser already holds the file in upload-data.contents, so it
+        # is not echoed back into a store; the analysis callback reads it there
+        [
+            Output('csv-headers-store', 'data'),
+            Output('processing-status', 'children'),
+            Output('all-doors-from-csv-store', 'data'),
+            Output('interactive-setup-container', 'style'),
+            Output('upload-data', 'style'),
+            Output('processed-data-store', 'data')  # Store processed data
+        ],
+        Input('upload-data', 'contents'),
+        State('upload-data', 'filename')
+    )(enhanced_file_upload_with_processing_v6),
+
+    # 2. Mapping dropdowns
+    _spec(
+        [
+            Output('dropdown-mapping-area', 'children'),
+            Output('confirm-header-map-button', 'style'),
+            Output('mapping-ui-section', 'style')
+        ],
+        Input('csv-headers-store', 'data')
+    )(create_intelligent_mapping_dropdowns_v6),
+
+    # 6. Main analysis
+    _spec(
+        [
+            # Visibility outputs
+            Output('yosai-custom-header', 'style'),
+            Output('stats-panels-container', 'style'),
+            Output('analytics-section', 'style'),
+            Output('charts-section', 'style'),
+            Output('export-section', 'style'),
+            Output('graph-output-container', 'style'),
+
+            # Basic stats outputs (maintaining compatibility)
+            Output('total-access-events-H1', 'children'),
+            Output('event-date-range-P', 'children'),
+            Output('most-active-devices-table-body', 'children'),
+            Output('onion-graph', 'elements'),
+            Output('processing-status', 'children', allow_duplicate=True),
+
+            # Enhanced stats outputs (if available)
+            Output('stats-unique-users', 'children'),
+            Output('stats-avg-events-per-user', 'children'),
+            Output('stats-most-active-user', 'children'),
+            Output('stats-devices-per-user', 'children'),
+            Output('stats-peak-hour', 'children'),
+            Output('total-devices-count', 'children'),
+            Output('entrance-devices-count', 'children'),
+            Output('high-security-devices', 'children'),
+
+            # Advanced analytics outputs (if available)
+            Output('traffic-pattern-insight', 'children'),
+            Output('security-score-insight', 'children'),
+            Output('efficiency-insight', 'children'),
+            Output('anomaly-insight', 'children'),
+            Output('peak-hour-display', 'children'),
+            Output('peak-day-display', 'children'),
+            Output('busiest-floor', 'children'),
+            Output('entry-exit-ratio', 'children'),
+            Output('weekend-vs-weekday', 'children'),
+            Output('security-level-breakdown', 'children'),
+            Output('compliance-score', 'children'),
+            Output('anomaly-alerts', 'children'),
+
+            # Chart outputs (if available)
+            Output('main-analytics-chart', 'figure'),
+            Output('security-pie-chart', 'figure'),
+            Output('heatmap-chart', 'figure'),
+
+            # Store enhanced metrics
+            Output('enhanced-metrics-store', 'data')
+        ],
+        Input('confirm-and-generate-button', 'n_clicks'),
+        [
+            State('upload-data', 'contents'),
+            State('processed-data-store', 'data'),
+            State('csv-headers-store', 'data'),
+            State('all-doors-from-csv-store', 'data'),
+            State({'type': 'mapping-dropdown', 'index': ALL}, 'value'),
+            State({'type': 'mapping-dropdown', 'index': ALL}, 'id'),
+            State('num-floors-input', 'value'),
+            State('manual-map-toggle', 'value')
+        ]
+    )(generate_comprehensive_enhanced_analysis_v6),
+
+    # 7. Chart type selector
+    _spec(
+        Output('main-analytics-chart', 'figure', allow_duplicate=True),
+        Input('chart-type-selector', 'value'),
+        State('enhanced-metrics-store', 'data')
+    )(update_comprehensive_main_chart_v6),
+
+    # 8. Export actions
+    _spec(
+        Output('export-status', 'children'),
+        [
+            Input('export-stats-csv', 'n_clicks'),
+            Input('export-charts-png', 'n_clicks'),
+            Input('generate-pdf-report', 'n_clicks'),
+            Input('refresh-analytics', 'n_clicks')
+        ],
+        State('enhanced-metrics-store', 'data')
+    )(handle_comprehensive_export_actions_v6),
+
+    # 9. Node tap
+    _spec(
+        Output('tap-node-data-output', 'children'),
+        Input('onion-graph', 'tapNodeData')
+    )(display_comprehensive_node_data_v6),
+)
+
+# Apps that already carry the Version 6.0 callbacks
+_REGISTERED = weakref.WeakSet()
+
+def _clientside_spec(function_name, *args, **kwargs):
+    """Capture a ``dash_clientside.ui`` callback as a ``(name, args, kwargs)`` entry"""
+    for dependencies in args:
+        _intern_ids(dependencies)
+    return (function_name, args, kwargs)
+
+# Pure UI state, handled in the browser by assets/clientside.js
+_CLIENTSIDE_SPECS = (
+    # 3. Mapping confirmation
+    _clientside_spec(
+        'confirm_mapping',
+        [
+            Output('entrance-verification-ui-section', 'style'),
+            Output('mapping-ui-section', 'style', allow_duplicate=True),
+            Output('processing-status', 'children', allow_duplicate=True)
+        ],
+        Input('confirm-header-map-button', 'n_clicks'),
+        [
+            State({'type': 'mapping-dropdown', 'index': ALL}, 'value'),
+            State({'type': 'mapping-dropdown', 'index': ALL}, 'id'),
+            State('required-column-labels-store', 'data')
+        ]
+    ),
+    # 4. Classification toggle
+    _clientside_spec(
+        'toggle_classification',
+        Output('door-classification-table-container', 'style'),
+        Input('manual-map-toggle', 'value')
+    ),
+    # 5. Floor display
+    _clientside_spec(
+        'format_floors',
+        Output('num-floors-display', 'children'),
+        Input('num-floors-input', 'value')
+    ),
+    # 10. Radio toggle styling
+    _clientside_spec(
+        'style_manual_toggle',
+        Output('manual-map-toggle', 'value', allow_duplicate=True),
+        Input('manual-map-toggle', 'value')
+    ),
+)
+
+def register_callbacks(app):
+    """Register all Version 6.0 dashboard callbacks on the given Dash app
+
+    Calling it again for the same app is a no-op, so no callback is ever
+    attached twice. A registration error aborts app creation instead of
+    leaving it half-wired.
     """
-    function(value) {
-        setTimeout(function() {
-            const container = document.querySelector('#manual-map-toggle');
-            if (!container) return value;
-            
-            const inputs = container.querySelectorAll('input[type="radio"]');
-            const labels = container.querySelectorAll('label');
-            
-            inputs.forEach((input, index) => {
-                const label = labels[index];
-                if (!label) return;
-                
-                // Apply enhanced styling
-                Object.assign(label.style, {
-                    display: 'inline-block',
-                    padding: '10px 24px',
-                    margin: '0 8px',
-                    borderRadius: '20px',
-                    border: '2px solid #4A5568',
-                    cursor: 'pointer',
-                    transition: 'all 0.3s ease',
-                    fontWeight: '500',
-                    minWidth: '80px',
-                    textAlign: 'center',
-                    userSelect: 'none',
-                    fontSize: '0.9rem'
-                });
-                
-                if (input.checked) {
-                    if (input.value === 'no') {
-                        Object.assign(label.style, {
-                            backgroundColor: '#E02020',
-                            borderColor: '#E02020',
-                            color: 'white',
-                            boxShadow: '0 2px 8px rgba(224, 32, 32, 0.4)',
-                            transform: 'translateY(-1px)'
-                        });
-                    } else if (input.value === 'yes') {
-                        Object.assign(label.style, {
-                            backgroundColor: '#2196F3',
-                            borderColor: '#2196F3',
-                            color: 'white',
-                            boxShadow: '0 2px 8px rgba(33, 150, 243, 0.4)',
-                            transform: 'translateY(-1px)'
-                        });
-                    }
-                } else {
-                    Object.assign(label.style, {
-                        backgroundColor: '#2D3748',
-                        borderColor: '#4A5568',
-                        color: '#A0AEC0',
-                        boxShadow: '0 1px 3px rgba(0, 0, 0, 0.1)',
-                        transform: 'translateY(0)'
-                    });
-                }
-                
-                // Hide radio inputs
-                input.style.display = 'none';
-            });
-        }, 100);
-        
-        return value;
+    if app in _REGISTERED:
+        logger.debug("Callbacks already registered on %r; skipping", app)
+        return
+    name = None
+    try:
+        for name, args, kwargs, func in _CALLBACK_SPECS:
+            app.callback(*args, **kwargs)(func)
+        for name, args, kwargs in _CLIENTSIDE_SPECS:
+            app.clientside_callback(ClientsideFunction('ui', name), *args, **kwargs)
+    except Exception:
+        logger.exception("Callback registration failed: %s", name)
+        raise
+
+    _REGISTERED.add(app)
+
+# Health endpoint: system metrics are sampled at most once per interval per
+# process, so request volume never translates into extra psutil syscalls.
+# cpu_percent() reports usage since its previous call, i.e. since the last
+# sample (or since the route was registered, for the first one).
+_HEALTH_SAMPLE_INTERVAL = 10  # seconds
+_health_sample = None  # (timestamp, cpu_percent, memory_percent)
+_health_sample_lock = threading.Lock()
+
+def _latest_health_sample():
+    """Return the system metrics sample, refreshing it once it is stale"""
+    global _health_sample
+    if psutil is None:
+        return None
+    with _health_sample_lock:
+        sample = _health_sample
+        if sample is None or time.time() - sample[0] >= _HEALTH_SAMPLE_INTERVAL:
+            sample = (time.time(), psutil.cpu_percent(interval=None), psutil.virtual_memory().percent)
+            _health_sample = sample
+    return sample
+
+def _health_snapshot():
+    """Current health payload built from the latest metrics sample"""
+    snapshot = {
+        'timestamp': time.time(),
+        'status': 'healthy',
+        'components': dict(components_available),
     }
-    """,
-    Output('manual-map-toggle', 'value', allow_duplicate=True),
-    Input('manual-map-toggle', 'value'),
-    prevent_initial_call=True
-)
+    sample = _latest_health_sample()
+    if sample is not None:
+        snapshot['sampled_at'], snapshot['cpu_percent'], snapshot['memory_percent'] = sample
+    return snapshot
+
+def register_health_route(server):
+    """Expose ``/_health`` on the Flask server for monitoring and admin panels"""
+    if psutil is not None:
+        # The first cpu_percent(None) call has no baseline and returns 0.0;
+        # make it here so the first /_health sample is a real reading
+        psutil.cpu_percent(interval=None)
+
+    @server.route('/_health')
+    def health():
+        return jsonify(_health_snapshot())
+
+# Fingerprinted asset URLs (``?m=<mtime>``) change whenever the file does
+_IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+def register_asset_cache_headers(server, max_age):
+    """Add Cache-Control headers to responses served from ``/assets/``"""
+    revalidate = f'public, max-age={max_age}'
+
+    @server.after_request
+    def _asset_cache_control(response):
+        if request.path.startswith('/assets/'):
+            response.headers['Cache-Control'] = (
+                _IMMUTABLE_CACHE_CONTROL if 'm' in request.args else revalidate
+            )
+        return response
+
+def cache_layout_response(app):
+    """Serialize the static layout once and serve ``/_dash-layout`` from that payload
+
+    A gzip copy is built alongside it, so clients that accept gzip get the
+    compressed bytes without per-request compression work.
+    """
+    from plotly.io.json import to_json_plotly
+
+    # Encoded once so each request hands the WSGI server ready-made bytes
+    payload = to_json_plotly(app.layout).encode('utf-8')
+    payload_gz = gzip.compress(payload, compresslevel=6)
+    endpoint = app.config.routes_pathname_prefix + '_dash-layout'
+
+    def serve_cached_layout():
+        headers = {'Cache-Control': 'public, max-age=60', 'Vary': 'Accept-Encoding'}
+        if request.accept_encodings['gzip'] > 0:
+            headers['Content-Encoding'] = 'gzip'
+            return Response(payload_gz, mimetype='application/json', headers=headers)
+        return Response(payload, mimetype='application/json', headers=headers)
+
+    app.server.view_functions[endpoint] = serve_cached_layout
+
+def cache_dependencies_response(app):
+    """Serve ``/_dash-dependencies`` from the payload built for the first request
+
+    The callback list is fixed once Dash has merged any ``dash.callback``
+    registrations on that first request, so later page loads reuse its bytes.
+    """
+    endpoint = app.config.routes_pathname_prefix + '_dash-dependencies'
+    build_dependencies = app.server.view_functions[endpoint]
+    payload = None
+
+    def serve_cached_dependencies():
+        nonlocal payload
+        if payload is None:
+            payload = build_dependencies().get_data()
+        return Response(payload, mimetype='application/json')
+
+    app.server.view_functions[endpoint] = serve_cached_dependencies
+
+def install_orjson_provider(server):
+    """Serialize the Flask server's JSON responses with orjson when it is installed
+
+    Dash encodes layouts and callback outputs through plotly's
+    ``to_json_plotly``; its engine is pinned to orjson as well, instead of
+    being re-resolved by the "auto" setting on every response.
+    """
+    if orjson is None:
+        return
+    from flask.json.provider import DefaultJSONProvider
+    import plotly.io
+
+    plotly.io.json.config.default_engine = 'orjson'
+
+    class OrjsonProvider(DefaultJSONProvider):
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(
+                obj,
+                default=self.default,
+                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+            ).decode()
+
+    server.json = OrjsonProvider(server)
+
+# Layout, callback and asset responses are text that compresses well
+_COMPRESS_MIMETYPES = [
+    'application/json',
+    'application/javascript',
+    'text/javascript',
+    'text/html',
+    'text/css',
+]
+
+def install_compression(server):
+    """gzip/brotli-compress the Flask server's responses when flask-compress is installed"""
+    if Compress is None:
+        return
+    server.config.setdefault('COMPRESS_MIMETYPES', _COMPRESS_MIMETYPES)
+    server.config.setdefault('COMPRESS_LEVEL', 6)
+    Compress(server)
 
 # ============================================================================
 # STARTUP AND FINAL CONFIGURATION
 # ============================================================================
 
-print("✅ Fully integrated callback registration complete")
-print(f"🎯 Enhanced Analytics Dashboard Status:")
-print(f"   📊 Enhanced Stats: {'✅ ACTIVE' if components_available['enhanced_stats'] else '❌ Not Available'}")
-print(f"   📤 Upload Component: {'✅ ACTIVE' if components_available['upload'] else '❌ Not Available'}")
-print(f"   🗺️ Mapping Component: {'✅ ACTIVE' if components_available['mapping'] else '❌ Not Available'}")
-print(f"   🏷️ Classification Component: {'✅ ACTIVE' if components_available['classification'] else '❌ Not Available'}")
-print(f"   📈 Cytoscape Graphs: {'✅ ACTIVE' if components_available['cytoscape'] else '❌ Not Available'}")
-print(f"   🎨 Main Layout: {'✅ ACTIVE' if components_available['main_layout'] else '❌ Using Fallback'}")
+@functools.lru_cache(maxsize=None)
+def _get_theme():
+    """Return the Bootstrap theme stylesheet URL, importing dbc on first use"""
+    import dash_bootstrap_components as dbc
+    return dbc.themes.DARKLY
+
+# Startup status lines, logged in debug mode only
+_STATUS_LABELS = (
+    ('enhanced_stats', '📊 Enhanced Stats'),
+    ('upload', '📤 Upload Component'),
+    ('mapping', '🗺️ Mapping Component'),
+    ('classification', '🏷️ Classification Component'),
+    ('cytoscape', '📈 Cytoscape Graphs'),
+    ('main_layout', '🎨 Main Layout'),
+)
+
+# Feature list logged at DEBUG level when the dev server starts
+_FEATURES = (
+    'Comprehensive CSV Upload with Auto-Suggestions',
+    'Intelligent Column Mapping with Smart Detection',
+    'Advanced Facility Configuration',
+    'Optional Manual Door Classification',
+    'Enhanced Statistics with 20+ Metrics',
+    'Advanced Analytics Insights',
+    'Interactive Data Visualization Charts',
+    'Export Capabilities (CSV, PNG, PDF)',
+    'Interactive Security Model Graph',
+    'Real-time Analytics Dashboard',
+)
+
+def create_app():
+    """Create the Dash app with the Version 6.0 layout and callbacks"""
+    import dash
+
+    _detect_components()
+    config = get_config()
+
+    app = dash.Dash(
+        __name__,
+        suppress_callback_exceptions=True,
+        prevent_initial_callbacks=True,
+        update_title="Updating..." if config.debug else None,
+        assets_folder='assets',
+        assets_external_path=config.asset_cdn,
+        external_stylesheets=[_get_theme()],
+        meta_tags=[
+            {"name": "viewport", "content": "width=device-width, initial-scale=1"},
+            {"name": "description", "content": "Yōsai Enhanced Analytics Dashboard v6.0 - Advanced Access Control Analytics"}
+        ]
+    )
+    app.title = "Yōsai Enhanced Analytics Dashboard v6.0"
+
+    # Asset paths, resolved once and shared with the layout builders
+    assets = types.MappingProxyType({
+        key: app.get_asset_url(os.path.basename(path)) for key, path in DEFAULT_ICONS.items()
+    })
+
+    logger.debug("Assets loaded: %s", assets['upload_default'])
+
+    # Create Version 6.0 comprehensive integrated layout
+    app.layout = create_fully_integrated_layout_v6(app, assets)
+    cache_layout_response(app)
+
+    logger.debug("Version 6.0 layout created; components: %s", components_available)
+
+    register_callbacks(app)
+    cache_dependencies_response(app)
+    install_orjson_provider(app.server)
+    install_compression(app.server)
+    register_health_route(app.server)
+    register_asset_cache_headers(app.server, config.cache_timeout)
+
+    logger.debug("Fully integrated callback registration complete")
+    if config.debug and logger.isEnabledFor(logging.INFO):
+        logger.info("🎯 Enhanced Analytics Dashboard Status:")
+        for key, label in _STATUS_LABELS:
+            logger.info("   %s: %s", label, '✅ ACTIVE' if components_available[key] else '❌ Not Available')
+
+    return app
+
+def __getattr__(name):
+    """Build the app lazily so importing this module stays cheap (PEP 562)
+
+    This is the WSGI entry (``app:server``), so it also applies the
+    configured LOG_LEVEL / LOG_FILE, as ``__main__`` does for the dev server.
+    """
+    if name in ('app', 'server'):
+        config = get_config()
+        setup_application_logging(config.log_level, config.log_file)
+        dash_app = create_app()
+        globals().update(app=dash_app, server=dash_app.server)
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 if __name__ == "__main__":
-    print("\n🚀 Starting Fully Integrated Enhanced Analytics Dashboard...")
-    print("🌐 Dashboard will be available at: http://127.0.0.1:8050")
-    print("\n🎯 FEATURES AVAILABLE:")
-    print("   • Comprehensive CSV Upload with Auto-Suggestions")
-    print("   • Intelligent Column Mapping with Smart Detection")
-    print("   • Advanced Facility Configuration")
-    print("   • Optional Manual Door Classification")
-    print("   • Enhanced Statistics with 20+ Metrics")
-    print("   • Advanced Analytics Insights")
-    print("   • Interactive Data Visualization Charts")
-    print("   • Export Capabilities (CSV, PNG, PDF)")
-    print("   • Interactive Security Model Graph")
-    print("   • Real-time Analytics Dashboard")
+    config = get_config()
+    setup_application_logging(config.log_level, config.log_file)
+    app = create_app()
+
+    logger.info("🚀 Starting Fully Integrated Enhanced Analytics Dashboard at http://127.0.0.1:8050")
+    for feature in _FEATURES:
+        logger.debug("   • %s", feature)
     
+    # DEBUG=true (see AppConfig.from_env) runs the Flask dev server with dev tools
+    debug = config.debug
+
     try:
-        app.run(
-            debug=True,
-            host='127.0.0.1',
-            port=8050,
-            dev_tools_hot_reload=True,
-            dev_tools_ui=True,
-            dev_tools_props_check=False
-        )
+        if debug:
+            # HOT_RELOAD=false keeps the debugger but drops the file watcher
+            # and the browser's /_reload-hash polling
+            app.run(
+                debug=debug,
+                host='127.0.0.1',
+                port=8050,
+                dev_tools_hot_reload=config.hot_reload,
+                dev_tools_ui=debug,
+                dev_tools_props_check=False
+            )
+        else:
+            # The Flask dev server handles one request at a time; waitress
+            # lets concurrent callbacks run on a thread pool.
+            from waitress import serve
+            serve(app.server, host='127.0.0.1', port=8050,
+                  threads=config.server_threads)
     except Exception as e:
-        print(f"💥 Failed to start server: {e}")
-        traceback.print_exc()
\ No newline at end of file
+        logger.exception("Failed to start server: %s", e)
\ No newline at end of file
@@ -0,0 +1,74 @@
+// assets/clientside.js - Browser-side callbacks for pure UI state
+//
+// Registered from app.py with ClientsideFunction('ui', <name>), so these
+// interactions never round-trip to the server. Anything that needs the
+// uploaded data stays a Python callback.
+
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    ui: {
+        // Show the door classification table only in manual mode
+        toggle_classification: function(toggle_value) {
+            if (toggle_value === 'yes') {
+                return {display: 'block', marginTop: '20px', animation: 'slideDown 0.3s ease-out'};
+            }
+            return {display: 'none'};
+        },
+
+        // "4 floors" label next to the floor input
+        format_floors: function(value) {
+            var floors = (value === null || value === undefined) ? 4 : parseInt(value, 10);
+            return floors + ' floor' + (floors !== 1 ? 's' : '');
+        },
+
+        // Flip one class on the container; the #manual-map-toggle.mmt-*
+        // rules in custom.css colour the labels
+        style_manual_toggle: function(value) {
+            var container = document.getElementById('manual-map-toggle');
+            if (container) {
+                container.classList.toggle('mmt-yes', value === 'yes');
+                container.classList.toggle('mmt-no', value === 'no');
+            }
+            return window.dash_clientside.no_update;
+        },
+
+        // Validate the column mapping and reveal the classification step;
+        // labels maps each required column key to its display name
+        confirm_mapping: function(n_clicks, values, ids, labels) {
+            var hide = {display: 'none'};
+            var show = {display: 'block'};
+            if (!n_clicks) {
+                return [hide, show, window.dash_clientside.no_update];
+            }
+            var missing = [];
+            (values || []).forEach(function(value, i) {
+                if (value === null || value === undefined) {
+                    var key = ids[i].index;
+                    missing.push((labels && labels[key]) || key);
+                }
+            });
+            if (missing.length) {
+                return [
+                    hide,
+                    show,
+                    '⚠️ Please map all required columns. Missing: ' +
+                        missing.slice(0, 2).join(', ') + (missing.length > 2 ? '...' : '')
+                ];
+            }
+            return [
+                {
+                    display: 'block',
+                    padding: '25px',
+                    backgroundColor: '#1A2332',
+                    borderRadius: '12px',
+                    margin: '20px auto',
+                    width: '85%',
+                    maxWidth: '800px',
+                    border: '1px solid #2D3748',
+                    boxShadow: '0 4px 6px rgba(0, 0, 0, 0.1)'
+                },
+                hide,
+                '✅ Column mapping completed! Configure your facility settings below for Version 6.0 enhanced analytics:'
+            ];
+        }
+    }
+});
@@ -5,7 +5,8 @@ Replaces all other config files
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Mapping
+from types import MappingProxyType
 import os
 from utils.logging_config import get_logger
 
@@ -32,12 +33,12 @@ SECURITY_LEVELS = {
 }
 
 # Default icon paths
-DEFAULT_ICONS = {
+DEFAULT_ICONS = MappingProxyType({
     'upload_default': '/assets/upload_file_csv_icon.png',
     'upload_success': '/assets/upload_file_csv_icon_success.png',
     'upload_fail': '/assets/upload_file_csv_icon_fail.png',
     'main_logo': '/assets/logo_white.png'
-}
+})
 
 # File processing limits
 FILE_LIMITS = {
@@ -55,6 +56,7 @@ FILE_LIMITS = {
 class AppConfig:
     """Main application configuration"""
     debug: bool = False
+    hot_reload: bool = True
     port: int = 8050
     host: str = '127.0.0.1'
     suppress_callback_exceptions: bool = True
@@ -67,6 +69,8 @@ class AppConfig:
     # Performance settings
     cache_timeout: int = 3600
     max_workers: int = 4
+    server_threads: int = 8
+    asset_cdn: Optional[str] = None  # Base URL for /assets only; Dash bundles stay local
     
     # Logging settings
     log_level: str = 'INFO'
@@ -77,11 +81,14 @@ class AppConfig:
         """Create configuration from environment variables"""
         return cls(
             debug=os.getenv('DEBUG', 'False').lower() == 'true',
+            hot_reload=os.getenv('HOT_RELOAD', 'True').lower() == 'true',
             port=int(os.getenv('PORT', '8050')),
             host=os.getenv('HOST', '127.0.0.1'),
             secret_key=os.getenv('SECRET_KEY'),
             cache_timeout=int(os.getenv('CACHE_TIMEOUT', '3600')),
             max_workers=int(os.getenv('MAX_WORKERS', '4')),
+            server_threads=int(os.getenv('SERVER_THREADS', '8')),
+            asset_cdn=os.getenv('ASSET_CDN'),
             log_level=os.getenv('LOG_LEVEL', 'INFO'),
             log_file=os.getenv('LOG_FILE')
         )
@@ -174,7 +181,7 @@ class Settings:
     # Direct access to constants
     required_columns: Dict[str, str] = field(default_factory=lambda: REQUIRED_INTERNAL_COLUMNS)
     security_levels: Dict[int, Dict[str, str]] = field(default_factory=lambda: SECURITY_LEVELS)
-    default_icons: Dict[str, str] = field(default_factory=lambda: DEFAULT_ICONS)
+    default_icons: Mapping[str, str] = field(default_factory=lambda: DEFAULT_ICONS)
     file_limits: Dict[str, Any] = field(default_factory=lambda: FILE_LIMITS)
 
 # ============================================================================
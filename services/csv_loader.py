@@ -1,7 +1,6 @@
 # services/csv_loader.py
 import pandas as pd
 import io
-import traceback
 from config.settings import REQUIRED_INTERNAL_COLUMNS
 from utils.logging_config import get_logger
 logger = get_logger(__name__)
@@ -26,9 +25,9 @@ def load_csv_event_log(csv_file_obj, column_mapping, timestamp_format=None):
             event_df[timestamp_col] = pd.to_datetime(event_df[timestamp_col], errors='coerce')
             event_df.dropna(subset=[timestamp_col], inplace=True)
         
-        logger.info(f"Loaded {len(event_df)} events")
+        logger.info("Loaded %s events", len(event_df))
         return event_df
         
     except Exception as e:
-        logger.info(f"Error loading CSV: {e}")
+        logger.exception("Error loading CSV: %s", e)
         return None
@@ -41,7 +41,7 @@ def prepare_path_visualization_data(all_paths_df, source_col='SourceDoor',
     else: # If path_widths_df became empty after groupby (e.g. no frequencies)
         path_widths_df = pd.DataFrame(columns=['Door1', 'Door2', 'PathWidth'])
         
-    logger.info(f"Prepared {len(path_widths_df)} unique undirected paths with widths.")
+    logger.info("Prepared %s unique undirected paths with widths.", len(path_widths_df))
     return path_widths_df
 
 
@@ -53,20 +53,20 @@ def prepare_cytoscape_elements(device_attributes_df, path_viz_data_df, all_paths
         logger.info("DEBUG: device_attributes_df empty in prepare_cytoscape_elements. Cannot create nodes.")
         return [], []
 
-    logger.info(f"DEBUG: device_attributes_df columns: {device_attributes_df.columns.tolist()}")
+    logger.info("DEBUG: device_attributes_df columns: %s", device_attributes_df.columns.tolist())
     
     # Use simple 'DoorID' column name (not the display name)
     doorid_col = 'DoorID'
     
     # Check if the device_attributes_df has the correct column name
     if doorid_col not in device_attributes_df.columns:
-        logger.info(f"Error: '{doorid_col}' column not found in device_attributes_df.")
-        logger.info(f"Available columns: {device_attributes_df.columns.tolist()}")
+        logger.info("Error: '%s' column not found in device_attributes_df.", doorid_col)
+        logger.info("Available columns: %s", device_attributes_df.columns.tolist())
         return [], []
 
     # Use the simple column name consistently
     current_device_ids = set(device_attributes_df[doorid_col].astype(str).unique())
-    logger.info(f"DEBUG: Found {len(current_device_ids)} unique devices for nodes.")
+    logger.info("DEBUG: Found %s unique devices for nodes.", len(current_device_ids))
 
     dev_layers = {}
     if doorid_col in device_attributes_df.columns and 'FinalGlobalDeviceDepth' in device_attributes_df.columns:
@@ -152,5 +152,5 @@ def prepare_cytoscape_elements(device_attributes_df, path_viz_data_df, all_paths
                     }
                 })
     
-    logger.info(f"DEBUG: Cytoscape Prep: Prepared {len(nodes)} nodes, {len(edges)} edges.")
+    logger.info("DEBUG: Cytoscape Prep: Prepared %s nodes, %s edges.", len(nodes), len(edges))
     return nodes, edges
\ No newline at end of file
@@ -6,7 +6,7 @@ logger = get_logger(__name__)
 def override_config_for_testing(original_config):
     """Temporary override to fix the filtering issue"""
     logger.info("=== APPLYING TEMPORARY CONFIG OVERRIDE ===")
-    logger.info(f"Original config: {original_config}")
+    logger.info("Original config: %s", original_config)
 
     # Create a working config
     working_config = original_config.copy()
@@ -14,7 +14,7 @@ def override_config_for_testing(original_config):
     working_config["invalid_phrases_exact"] = []  # Remove filter
     working_config["invalid_phrases_contain"] = []  # Remove filter
 
-    logger.info(f"New config: {working_config}")
+    logger.info("New config: %s", working_config)
     return working_config
 
 
@@ -62,35 +62,36 @@ def run_onion_model_processing(
         Tuple of (enriched_df, device_attributes_df, path_viz_data_df, all_paths_df)
     """
     try:
-        logger.info(f"=== DEBUG: Starting onion model processing ===")
-        logger.info(f"DEBUG: Raw data shape: {raw_df.shape}")
-        logger.info(f"DEBUG: Raw data columns: {list(raw_df.columns)}")
-        logger.info(f"DEBUG: Config params: {config_params}")
-        logger.info(f"DEBUG: Confirmed entrances: {confirmed_official_entrances}")
-        logger.info(f"DEBUG: Detailed classifications: {detailed_door_classifications}")
+        logger.debug("=== Starting onion model processing ===")
+        logger.debug("Raw data shape: %s", raw_df.shape)
+        logger.debug("Raw data columns: %s", list(raw_df.columns))
+        logger.debug("Config params: %s", config_params)
+        logger.debug("Confirmed entrances: %s", confirmed_official_entrances)
+        logger.debug("Detailed classifications: %s", detailed_door_classifications)
 
-        logger.info(f"Starting onion model processing for {len(raw_df)} records")
+        logger.info("Starting onion model processing for %s records", len(raw_df))
 
         # Step 1: Clean and prepare data
-        logger.info(f"\n=== Step 1: Cleaning data ===")
+        logger.info("\n=== Step 1: Cleaning data ===")
         cleaned_df = clean_access_data(raw_df, config_params)
-        logger.info(f"DEBUG: Cleaned data shape: {cleaned_df.shape}")
+        logger.debug("Cleaned data shape: %s", cleaned_df.shape)
 
         if len(cleaned_df) == 0:
             logger.info("ERROR: No data remaining after cleaning!")
             return pd.DataFrame(), pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
 
         # Step 2: Identify entrances and calculate device depths
-        logger.info(f"\n=== Step 2: Calculating device attributes ===")
+        logger.info("\n=== Step 2: Calculating device attributes ===")
         device_attributes = calculate_device_attributes(
             cleaned_df,
             config_params,
             confirmed_official_entrances,
             detailed_door_classifications,
         )
-        logger.info(f"DEBUG: Device attributes shape: {device_attributes.shape}")
-        logger.info(
-            f"DEBUG: Device attributes columns: {list(device_attributes.columns)}"
+        logger.debug("Device attributes shape: %s", device_attributes.shape)
+        logger.debug(
+            "Device attributes columns: %s",
+            list(device_attributes.columns),
         )
 
         if len(device_attributes) == 0:
@@ -98,51 +99,53 @@ def run_onion_model_processing(
             return cleaned_df, pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
 
         # Step 3: Generate user paths and transitions
-        logger.info(f"\n=== Step 3: Generating user paths ===")
+        logger.info("\n=== Step 3: Generating user paths ===")
         all_paths_df = generate_user_paths(cleaned_df, device_attributes)
-        logger.info(f"DEBUG: All paths shape: {all_paths_df.shape}")
-        logger.info(
-            f"DEBUG: All paths columns: {list(all_paths_df.columns) if not all_paths_df.empty else 'EMPTY'}"
+        logger.debug("All paths shape: %s", all_paths_df.shape)
+        logger.debug(
+            "All paths columns: %s",
+            list(all_paths_df.columns) if not all_paths_df.empty else 'EMPTY',
         )
 
         if len(all_paths_df) == 0:
             logger.info("WARNING: No user paths generated!")
 
         # Step 4: Prepare visualization data
-        logger.info(f"\n=== Step 4: Preparing visualization data ===")
+        logger.info("\n=== Step 4: Preparing visualization data ===")
         path_viz_data = prepare_path_visualization_data(all_paths_df)
-        logger.info(f"DEBUG: Path viz data shape: {path_viz_data.shape}")
-        logger.info(
-            f"DEBUG: Path viz data columns: {list(path_viz_data.columns) if not path_viz_data.empty else 'EMPTY'}"
+        logger.debug("Path viz data shape: %s", path_viz_data.shape)
+        logger.debug(
+            "Path viz data columns: %s",
+            list(path_viz_data.columns) if not path_viz_data.empty else 'EMPTY',
         )
 
         if len(path_viz_data) == 0:
             logger.info("WARNING: No visualization data prepared!")
 
         # Step 5: Enrich original data with processing results
-        logger.info(f"\n=== Step 5: Enriching data ===")
+        logger.info("\n=== Step 5: Enriching data ===")
         enriched_df = enrich_data_with_results(cleaned_df, device_attributes)
-        logger.info(f"DEBUG: Enriched data shape: {enriched_df.shape}")
+        logger.debug("Enriched data shape: %s", enriched_df.shape)
 
-        logger.info(f"\n=== FINAL RESULTS ===")
-        logger.info(f"Enriched DF: {enriched_df.shape}")
-        logger.info(f"Device Attributes: {device_attributes.shape}")
-        logger.info(f"Path Viz Data: {path_viz_data.shape}")
-        logger.info(f"All Paths: {all_paths_df.shape}")
+        logger.info("\n=== FINAL RESULTS ===")
+        logger.info("Enriched DF: %s", enriched_df.shape)
+        logger.info("Device Attributes: %s", device_attributes.shape)
+        logger.info("Path Viz Data: %s", path_viz_data.shape)
+        logger.info("All Paths: %s", all_paths_df.shape)
 
         logger.info("Onion model processing completed successfully")
 
         return enriched_df, device_attributes, path_viz_data, all_paths_df
 
     except Exception as e:
-        logger.info(f"ERROR in run_onion_model_processing: {str(e)}")
-        logger.error(f"Error in onion model processing: {str(e)}")
+        logger.info("ERROR in run_onion_model_processing: %s", e)
+        logger.error("Error in onion model processing: %s", e)
         raise DataProcessingError(f"Onion model processing failed: {str(e)}")
 
 
 def clean_access_data(df: pd.DataFrame, config_params: Dict[str, Any]) -> pd.DataFrame:
     """Clean and filter access control data"""
-    logger.info(f"DEBUG: Starting clean_access_data with {len(df)} records")
+    logger.debug("Starting clean_access_data with %s records", len(df))
     logger.info("Cleaning access data")
 
     # Get column names with error handling
@@ -158,8 +161,12 @@ def clean_access_data(df: pd.DataFrame, config_params: Dict[str, Any]) -> pd.Dat
     except (KeyError, NameError) as e:
         raise DataProcessingError(f"Required column constants not found: {str(e)}")
 
-    logger.info(
-        f"DEBUG: Using columns - timestamp: '{timestamp_col}', eventtype: '{eventtype_col}', doorid: '{doorid_col}', userid: '{userid_col}'"
+    logger.debug(
+        "Using columns - timestamp: '%s', eventtype: '%s', doorid: '%s', userid: '%s'",
+        timestamp_col,
+        eventtype_col,
+        doorid_col,
+        userid_col,
     )
 
     cleaned_df = df.copy()
@@ -175,52 +182,62 @@ def clean_access_data(df: pd.DataFrame, config_params: Dict[str, Any]) -> pd.Dat
             f"Missing required columns: {missing_columns}. Available columns: {list(cleaned_df.columns)}"
         )
 
-    logger.info(f"DEBUG: Before filtering - {len(cleaned_df)} records")
+    logger.debug("Before filtering - %s records", len(cleaned_df))
 
     # Filter by primary positive indicator
     primary_indicator = config_params.get(
         "primary_positive_indicator", "ACCESS GRANTED"
     )
-    logger.info(f"DEBUG: Filtering by primary indicator: '{primary_indicator}'")
+    logger.debug("Filtering by primary indicator: '%s'", primary_indicator)
 
     if primary_indicator:
         before_count = len(cleaned_df)
         cleaned_df = cleaned_df[
             cleaned_df[eventtype_col].str.contains(primary_indicator, na=False)
         ]
-        logger.info(
-            f"DEBUG: After primary indicator filter: {len(cleaned_df)} records (removed {before_count - len(cleaned_df)})"
+        logger.debug(
+            "After primary indicator filter: %s records (removed %s)",
+            len(cleaned_df),
+            before_count - len(cleaned_df),
         )
 
     # Remove invalid phrases
     invalid_exact = config_params.get("invalid_phrases_exact", [])
-    logger.info(f"DEBUG: Removing invalid exact phrases: {invalid_exact}")
+    logger.debug("Removing invalid exact phrases: %s", invalid_exact)
     for phrase in invalid_exact:
         before_count = len(cleaned_df)
         cleaned_df = cleaned_df[cleaned_df[eventtype_col] != phrase]
-        logger.info(
-            f"DEBUG: After removing '{phrase}': {len(cleaned_df)} records (removed {before_count - len(cleaned_df)})"
+        logger.debug(
+            "After removing '%s': %s records (removed %s)",
+            phrase,
+            len(cleaned_df),
+            before_count - len(cleaned_df),
         )
 
     invalid_contain = config_params.get("invalid_phrases_contain", [])
-    logger.info(f"DEBUG: Removing invalid contain phrases: {invalid_contain}")
+    logger.debug("Removing invalid contain phrases: %s", invalid_contain)
     for phrase in invalid_contain:
         before_count = len(cleaned_df)
         cleaned_df = cleaned_df[
             ~cleaned_df[eventtype_col].str.contains(phrase, na=False)
         ]
-        logger.info(
-            f"DEBUG: After removing contains '{phrase}': {len(cleaned_df)} records (removed {before_count - len(cleaned_df)})"
+        logger.debug(
+            "After removing contains '%s': %s records (removed %s)",
+            phrase,
+            len(cleaned_df),
+            before_count - len(cleaned_df),
         )
 
     # Remove duplicate scans (same door, same user, within threshold)
     threshold_seconds = config_params.get("same_door_scan_threshold_seconds", 10)
-    logger.info(f"DEBUG: Duplicate scan threshold: {threshold_seconds} seconds")
+    logger.debug("Duplicate scan threshold: %s seconds", threshold_seconds)
     if threshold_seconds > 0:
         before_count = len(cleaned_df)
         cleaned_df = remove_duplicate_scans(cleaned_df, threshold_seconds)
-        logger.info(
-            f"DEBUG: After duplicate removal: {len(cleaned_df)} records (removed {before_count - len(cleaned_df)})"
+        logger.debug(
+            "After duplicate removal: %s records (removed %s)",
+            len(cleaned_df),
+            before_count - len(cleaned_df),
         )
 
     # Sort by timestamp
@@ -228,14 +245,14 @@ def clean_access_data(df: pd.DataFrame, config_params: Dict[str, Any]) -> pd.Dat
 
     # Show sample of remaining data
     if len(cleaned_df) > 0:
-        logger.info(f"DEBUG: Sample of cleaned data:")
-        logger.info(cleaned_df[[doorid_col, userid_col, eventtype_col]].head())
-        logger.info(f"DEBUG: Unique doors: {cleaned_df[doorid_col].nunique()}")
-        logger.info(f"DEBUG: Unique users: {cleaned_df[userid_col].nunique()}")
+        logger.debug("Sample of cleaned data:")
+        logger.debug(cleaned_df[[doorid_col, userid_col, eventtype_col]].head())
+        logger.debug("Unique doors: %s", cleaned_df[doorid_col].nunique())
+        logger.debug("Unique users: %s", cleaned_df[userid_col].nunique())
     else:
         logger.info("WARNING: No data remaining after cleaning!")
 
-        logger.info(f"Cleaned data: {len(cleaned_df)} records remaining")
+        logger.info("Cleaned data: %s records remaining", len(cleaned_df))
     return cleaned_df
 
 
@@ -282,8 +299,8 @@ def calculate_device_attributes(
         except (KeyError, NameError) as e:
             raise DataProcessingError(f"Required column constants not found: {str(e)}")
 
-        logger.info(f"DEBUG: Expected doorid_col = '{doorid_col}'")
-        logger.info(f"DEBUG: Available columns in df = {list(df.columns)}")
+        logger.debug("Expected doorid_col = '%s'", doorid_col)
+        logger.debug("Available columns in df = %s", list(df.columns))
 
         # Validate column exists
         if doorid_col not in df.columns:
@@ -293,8 +310,10 @@ def calculate_device_attributes(
 
         # Get unique doors
         unique_doors = df[doorid_col].unique()
-        logger.info(
-            f"DEBUG: Found {len(unique_doors)} unique doors: {list(unique_doors)}"
+        logger.debug(
+            "Found %s unique doors: %s",
+            len(unique_doors),
+            list(unique_doors),
         )
 
         device_attrs = []
@@ -308,8 +327,11 @@ def calculate_device_attributes(
                 "UniqueUsers": door_data[userid_col].nunique(),
             }
 
-            logger.info(
-                f"DEBUG: Door '{door_id}' - Events: {attr['EventCount']}, Users: {attr['UniqueUsers']}"
+            logger.debug(
+                "Door '%s' - Events: %s, Users: %s",
+                door_id,
+                attr['EventCount'],
+                attr['UniqueUsers'],
             )
 
             # Apply detailed classifications if provided
@@ -319,8 +341,10 @@ def calculate_device_attributes(
                 attr["IsOfficialEntrance"] = classification.get("is_ee", False)
                 attr["IsStaircase"] = classification.get("is_stair", False)
                 attr["SecurityLevel"] = classification.get("security", "green")
-                logger.info(
-                    f"DEBUG: Applied detailed classification for '{door_id}': {classification}"
+                logger.debug(
+                    "Applied detailed classification for '%s': %s",
+                    door_id,
+                    classification,
                 )
             else:
                 # Default values
@@ -328,7 +352,7 @@ def calculate_device_attributes(
                 attr["IsOfficialEntrance"] = door_id in (confirmed_entrances or [])
                 attr["IsStaircase"] = False
                 attr["SecurityLevel"] = "green"
-                logger.info(f"DEBUG: Applied default classification for '{door_id}'")
+                logger.debug("Applied default classification for '%s'", door_id)
 
             # Calculate device depth (simplified heuristic)
             if attr["IsOfficialEntrance"]:
@@ -344,17 +368,21 @@ def calculate_device_attributes(
                 attr["SecurityLevel"] == "red" and attr["FinalGlobalDeviceDepth"] >= 2
             )
 
-            logger.info(
-                f"DEBUG: Final attributes for '{door_id}': Depth={attr['FinalGlobalDeviceDepth']}, IsEntrance={attr['IsOfficialEntrance']}"
+            logger.debug(
+                "Final attributes for '%s': Depth=%s, IsEntrance=%s",
+                door_id,
+                attr['FinalGlobalDeviceDepth'],
+                attr['IsOfficialEntrance'],
             )
             device_attrs.append(attr)
 
         device_attrs_df = pd.DataFrame(device_attrs)
-        logger.info(
-            f"DEBUG: Created device_attrs_df with columns: {list(device_attrs_df.columns)}"
+        logger.debug(
+            "Created device_attrs_df with columns: %s",
+            list(device_attrs_df.columns),
         )
-        logger.info(f"DEBUG: Device attributes summary:")
-        logger.info(
+        logger.debug("Device attributes summary:")
+        logger.debug(
             device_attrs_df[
                 ["DoorID", "EventCount", "FinalGlobalDeviceDepth", "IsOfficialEntrance"]
             ]
@@ -366,11 +394,11 @@ def calculate_device_attributes(
                 lambda door: calculate_most_common_next_door(df, door)
             )
 
-        logger.info(f"Calculated attributes for {len(device_attrs_df)} devices")
+        logger.info("Calculated attributes for %s devices", len(device_attrs_df))
         return device_attrs_df
 
     except Exception as e:
-        logger.info(f"ERROR in calculate_device_attributes: {str(e)}")
+        logger.info("ERROR in calculate_device_attributes: %s", e)
         raise DataProcessingError(f"Failed to calculate device attributes: {str(e)}")
 
 
@@ -384,14 +412,14 @@ def calculate_most_common_next_door(df: pd.DataFrame, door_id: str) -> str:
         doorid_col = REQUIRED_INTERNAL_COLUMNS["DoorID"]  # 'DoorID (Device Name)'
         userid_col = REQUIRED_INTERNAL_COLUMNS["UserID"]  # 'UserID (Person Identifier)'
     except (KeyError, NameError) as e:
-        logger.warning(f"Required column constants not found: {str(e)}")
+        logger.warning("Required column constants not found: %s", e)
         return ""
 
     # Validate columns exist
     required_cols = [timestamp_col, doorid_col, userid_col]
     missing_cols = [col for col in required_cols if col not in df.columns]
     if missing_cols:
-        logger.warning(f"Missing columns for next door calculation: {missing_cols}")
+        logger.warning("Missing columns for next door calculation: %s", missing_cols)
         return ""
 
     # Get all visits to this door
@@ -431,7 +459,7 @@ def generate_user_paths(
 ) -> pd.DataFrame:
     """Generate user movement paths between doors"""
     try:
-        logger.info(f"DEBUG: Starting generate_user_paths with {len(df)} records")
+        logger.debug("Starting generate_user_paths with %s records", len(df))
 
         # Get column names with error handling
         try:
@@ -445,10 +473,11 @@ def generate_user_paths(
         except (KeyError, NameError) as e:
             raise DataProcessingError(f"Required column constants not found: {str(e)}")
 
-        logger.info(f"DEBUG: generate_user_paths - doorid_col = '{doorid_col}'")
-        logger.info(f"DEBUG: generate_user_paths - df.columns = {list(df.columns)}")
-        logger.info(
-            f"DEBUG: generate_user_paths - device_attributes.columns = {list(device_attributes.columns)}"
+        logger.debug("generate_user_paths - doorid_col = '%s'", doorid_col)
+        logger.debug("generate_user_paths - df.columns = %s", list(df.columns))
+        logger.debug(
+            "generate_user_paths - device_attributes.columns = %s",
+            list(device_attributes.columns),
         )
 
         # Validate columns exist
@@ -469,10 +498,12 @@ def generate_user_paths(
             user_data_sorted = user_data.sort_values(timestamp_col)
 
             if users_processed <= 5:  # Debug first 5 users
-                logger.info(
-                    f"DEBUG: Processing user {user_id} with {len(user_data_sorted)} events"
+                logger.debug(
+                    "Processing user %s with %s events",
+                    user_id,
+                    len(user_data_sorted),
                 )
-                logger.info(f"DEBUG: User events: {list(user_data_sorted[doorid_col])}")
+                logger.debug("User events: %s", list(user_data_sorted[doorid_col]))
 
             for i in range(len(user_data_sorted) - 1):
                 current_door = user_data_sorted.iloc[i][doorid_col]
@@ -499,18 +530,24 @@ def generate_user_paths(
                     paths_found += 1
 
                     if paths_found <= 10:  # Debug first 10 paths
-                        logger.info(
-                            f"DEBUG: Path {paths_found}: {current_door} -> {next_door} ({time_diff:.0f}s)"
+                        logger.debug(
+                            "Path %s: %s -> %s (%.0fs)",
+                            paths_found,
+                            current_door,
+                            next_door,
+                            time_diff,
                         )
 
-        logger.info(
-            f"DEBUG: Processed {users_processed} users, found {paths_found} valid paths"
+        logger.debug(
+            "Processed %s users, found %s valid paths",
+            users_processed,
+            paths_found,
         )
 
         paths_df = pd.DataFrame(paths)
 
         if not paths_df.empty:
-            logger.info(f"DEBUG: Created paths_df with {len(paths_df)} rows")
+            logger.debug("Created paths_df with %s rows", len(paths_df))
 
             # Calculate transition frequencies
             transition_counts = (
@@ -518,22 +555,23 @@ def generate_user_paths(
                 .size()
                 .reset_index(name="TransitionFrequency")
             )
-            logger.info(f"DEBUG: Transition counts shape: {transition_counts.shape}")
+            logger.debug("Transition counts shape: %s", transition_counts.shape)
 
             paths_df = paths_df.merge(
                 transition_counts, on=["SourceDoor", "TargetDoor"]
             )
-            logger.info(f"DEBUG: After merge, paths_df shape: {paths_df.shape}")
+            logger.debug("After merge, paths_df shape: %s", paths_df.shape)
 
             # Add depth information - use 'DoorID' column from device_attributes
             if "DoorID" in device_attributes.columns:
                 device_depth_map = device_attributes.set_index("DoorID")[
                     "FinalGlobalDeviceDepth"
                 ].to_dict()
-                logger.info(f"DEBUG: Device depth map: {device_depth_map}")
+                logger.debug("Device depth map: %s", device_depth_map)
             else:
                 logger.info(
-                    f"WARNING: 'DoorID' column not found in device_attributes. Available: {list(device_attributes.columns)}"
+                    "WARNING: 'DoorID' column not found in device_attributes. Available: %s",
+                    list(device_attributes.columns),
                 )
                 device_depth_map = {}
 
@@ -543,30 +581,31 @@ def generate_user_paths(
                 paths_df["TargetDepth"] > paths_df["SourceDepth"]
             )
 
-            logger.info(f"DEBUG: Final paths_df columns: {list(paths_df.columns)}")
-            logger.info(f"DEBUG: Sample paths:")
-            logger.info(
+            logger.debug("Final paths_df columns: %s", list(paths_df.columns))
+            logger.debug("Sample paths:")
+            logger.debug(
                 paths_df[["SourceDoor", "TargetDoor", "TransitionFrequency"]].head()
             )
         else:
             logger.info("WARNING: No paths generated!")
 
-        logger.info(f"Generated {len(paths_df)} user path records")
+        logger.info("Generated %s user path records", len(paths_df))
         return paths_df
 
     except Exception as e:
-        logger.info(f"ERROR in generate_user_paths: {str(e)}")
+        logger.info("ERROR in generate_user_paths: %s", e)
         raise DataProcessingError(f"Failed to generate user paths: {str(e)}")
 
 
 def prepare_path_visualization_data(all_paths_df: pd.DataFrame) -> pd.DataFrame:
     """Prepare path data for visualization"""
-    logger.info(
-        f"DEBUG: Starting prepare_path_visualization_data with {len(all_paths_df)} paths"
+    logger.debug(
+        "Starting prepare_path_visualization_data with %s paths",
+        len(all_paths_df),
     )
 
     if all_paths_df.empty:
-        logger.info("DEBUG: No paths to visualize, returning empty DataFrame")
+        logger.debug("No paths to visualize, returning empty DataFrame")
         return pd.DataFrame(columns=["Door1", "Door2", "PathWidth"])
 
     # Create undirected path weights
@@ -575,8 +614,9 @@ def prepare_path_visualization_data(all_paths_df: pd.DataFrame) -> pd.DataFrame:
         lambda row: tuple(sorted([row["SourceDoor"], row["TargetDoor"]])), axis=1
     )
 
-    logger.info(
-        f"DEBUG: Created canonical pairs, sample: {paths_df['CanonicalPair'].head().tolist()}"
+    logger.debug(
+        "Created canonical pairs, sample: %s",
+        paths_df['CanonicalPair'].head().tolist(),
     )
 
     # Aggregate by canonical pairs
@@ -585,9 +625,9 @@ def prepare_path_visualization_data(all_paths_df: pd.DataFrame) -> pd.DataFrame:
     )
     path_weights.rename(columns={"TransitionFrequency": "PathWidth"}, inplace=True)
 
-    logger.info(f"DEBUG: Path weights shape: {path_weights.shape}")
-    logger.info(f"DEBUG: Sample path weights:")
-    logger.info(path_weights.head())
+    logger.debug("Path weights shape: %s", path_weights.shape)
+    logger.debug("Sample path weights:")
+    logger.debug(path_weights.head())
 
     # Split canonical pairs back to Door1, Door2
     if not path_weights.empty:
@@ -597,14 +637,14 @@ def prepare_path_visualization_data(all_paths_df: pd.DataFrame) -> pd.DataFrame:
             columns=["Door1", "Door2"],
         )
         path_viz_df = pd.concat([split_pairs, path_weights[["PathWidth"]]], axis=1)
-        logger.info(f"DEBUG: Final visualization data shape: {path_viz_df.shape}")
-        logger.info(f"DEBUG: Sample visualization data:")
-        logger.info(path_viz_df.head())
+        logger.debug("Final visualization data shape: %s", path_viz_df.shape)
+        logger.debug("Sample visualization data:")
+        logger.debug(path_viz_df.head())
     else:
         path_viz_df = pd.DataFrame(columns=["Door1", "Door2", "PathWidth"])
-        logger.info("DEBUG: No path weights generated")
+        logger.debug("No path weights generated")
 
-    logger.info(f"Prepared {len(path_viz_df)} path visualization records")
+    logger.info("Prepared %s path visualization records", len(path_viz_df))
     return path_viz_df
 
 
@@ -636,7 +676,8 @@ def enrich_data_with_results(
         ].to_dict("index")
     else:
         logger.warning(
-            f"Device attributes missing expected column 'DoorID'. Available: {list(device_attributes.columns)}"
+            "Device attributes missing expected column 'DoorID'. Available: %s",
+            list(device_attributes.columns),
         )
         device_info = {}
 
@@ -663,7 +704,7 @@ def enrich_data_with_results(
     # Add movement classification
     enriched_df["EventType_UserDay"] = "MOVEMENT"  # Simplified classification
 
-    logger.info(f"Enriched data with {len(enriched_df)} records")
+    logger.info("Enriched data with %s records", len(enriched_df))
     return enriched_df
 
 
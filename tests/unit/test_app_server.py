@@ -0,0 +1,239 @@
+import base64
+import gzip
+from collections import OrderedDict
+from types import SimpleNamespace
+
+import dash
+import pytest
+from dash import Input, Output, html
+from flask import Flask
+from plotly.io.json import to_json_plotly
+
+import app as app_module
+
+
+@pytest.fixture(scope='module')
+def dash_app():
+    return app_module.create_app()
+
+
+def test_register_callbacks_twice_is_a_noop(dash_app):
+    callback_count = len(dash_app._callback_list)
+    app_module.register_callbacks(dash_app)
+    assert len(dash_app._callback_list) == callback_count
+
+
+class _FakePsutil:
+    """psutil stand-in whose cpu_percent() has no baseline on its first call"""
+
+    def __init__(self):
+        self.cpu_calls = 0
+
+    def cpu_percent(self, interval=None):
+        self.cpu_calls += 1
+        return 0.0 if self.cpu_calls == 1 else 37.5
+
+    def virtual_memory(self):
+        return SimpleNamespace(percent=61.0)
+
+
+@pytest.fixture
+def health_client(monkeypatch):
+    monkeypatch.setattr(app_module, 'psutil', _FakePsutil())
+    monkeypatch.setattr(app_module, '_health_sample', None)
+    server = Flask(__name__)
+    app_module.register_health_route(server)
+    return server.test_client()
+
+
+def test_health_route_reports_a_primed_cpu_sample(health_client):
+    response = health_client.get('/_health')
+    assert response.status_code == 200
+    assert response.json['status'] == 'healthy'
+    assert response.json['cpu_percent'] == 37.5
+    assert response.json['memory_percent'] == 61.0
+
+
+def test_health_route_reuses_its_sample_within_the_interval(health_client):
+    first = health_client.get('/_health').json
+    second = health_client.get('/_health').json
+    assert second['sampled_at'] == first['sampled_at']
+    assert app_module.psutil.cpu_calls == 2
+
+
+def test_health_route_without_psutil_omits_metrics(monkeypatch):
+    monkeypatch.setattr(app_module, 'psutil', None)
+    server = Flask(__name__)
+    app_module.register_health_route(server)
+    payload = server.test_client().get('/_health').json
+    assert payload['status'] == 'healthy'
+    assert 'cpu_percent' not in payload
+
+
+def _small_dash_app():
+    """Minimal app whose layout passes Dash's first-request validation"""
+    small_app = dash.Dash(__name__)
+    small_app.layout = html.Div([
+        html.Button(id='refresh'),
+        html.P('access events ' * 200, id='summary'),
+    ])
+    small_app.callback(Output('summary', 'title'), Input('refresh', 'n_clicks'))(str)
+    return small_app
+
+
+def test_dependencies_body_is_cached():
+    small_app = _small_dash_app()
+    app_module.cache_dependencies_response(small_app)
+    client = small_app.server.test_client()
+    first = client.get('/_dash-dependencies')
+    second = client.get('/_dash-dependencies')
+    assert first.status_code == second.status_code == 200
+    assert first.data == second.data
+    assert b'summary.title' in first.data
+
+
+@pytest.fixture
+def layout_client():
+    small_app = _small_dash_app()
+    app_module.cache_layout_response(small_app)
+    return small_app.server.test_client(), to_json_plotly(small_app.layout).encode('utf-8')
+
+
+def test_layout_served_gzipped_when_accepted(layout_client):
+    client, layout_json = layout_client
+    response = client.get('/_dash-layout', headers={'Accept-Encoding': 'gzip'})
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert response.headers['Vary'] == 'Accept-Encoding'
+    assert gzip.decompress(response.data) == layout_json
+
+
+@pytest.mark.parametrize('accept_encoding', [None, 'identity', 'gzip;q=0'])
+def test_layout_served_plain_otherwise(layout_client, accept_encoding):
+    client, layout_json = layout_client
+    headers = {'Accept-Encoding': accept_encoding} if accept_encoding else {}
+    response = client.get('/_dash-layout', headers=headers)
+    assert 'Content-Encoding' not in response.headers
+    assert response.data == layout_json
+
+
+def test_create_app_reuses_the_cached_layout(dash_app):
+    assert app_module.create_app().layout is dash_app.layout
+
+
+def _csv_payload(rows):
+    csv_text = 'Timestamp,UserID,DoorID,EventType\n' + ''.join(
+        f'2024-01-01 08:00:00,U{i},D{i % 5},ACCESS GRANTED\n' for i in range(rows)
+    )
+    return base64.b64encode(csv_text.encode()).decode()
+
+
+def test_sniff_cache_hits_and_evicts(monkeypatch):
+    parsed = []
+    parse = app_module._parse_csv_sample
+
+    def counting_parse(decoded):
+        parsed.append(decoded)
+        return parse(decoded)
+
+    monkeypatch.setattr(app_module, '_upload_sniff_cache', OrderedDict())
+    monkeypatch.setattr(app_module, '_parse_csv_sample', counting_parse)
+
+    first = _csv_payload(10)
+    assert app_module._sniff_csv_upload(first) is app_module._sniff_csv_upload(first)
+    assert len(parsed) == 1
+
+    # Filling the cache with newer uploads evicts the oldest one
+    for rows in range(11, 11 + app_module._UPLOAD_SNIFF_CACHE_SIZE):
+        app_module._sniff_csv_upload(_csv_payload(rows))
+    assert len(app_module._upload_sniff_cache) == app_module._UPLOAD_SNIFF_CACHE_SIZE
+    parsed.clear()
+    app_module._sniff_csv_upload(first)
+    assert len(parsed) == 1
+
+
+def test_sniff_keeps_door_ids_verbatim_from_the_keyword_column():
+    door_ids = ['0012', '0034', '0056', '0078']
+    csv_text = 'Timestamp,Person,Device Name,Result\n' + ''.join(
+        f'2024-01-01 08:00:00,P{i % 40},{door_ids[i % 4]},OK\n' for i in range(50)
+    )
+    sniff = app_module._parse_csv_sample(csv_text.encode())
+    assert sniff['doors'] == door_ids
+    assert sniff['door_candidates'] == [('Device Name', 4, 2)]
+    assert (sniff['row_count'], sniff['column_count']) == (50, 4)
+
+def test_sniff_falls_back_to_column_cardinality():
+    csv_text = 'a,b,c\n' + ''.join(f'x,R{i % 8},{i}\n' for i in range(60))
+    sniff = app_module._parse_csv_sample(csv_text.encode())
+    # Both b (8 values) and c (60) are in range; the count nearer 25 wins
+    assert sniff['doors'] == [f'R{i}' for i in range(8)]
+
+
+def test_sniff_without_a_plausible_door_column():
+    csv_text = 'a,b\n' + ''.join(f'x,{i}\n' for i in range(300))
+    assert app_module._parse_csv_sample(csv_text.encode())['doors'] == []
+
+
+def test_count_csv_rows_matches_pandas_on_awkward_files():
+    quoted = 'a,b\n' + ''.join(f'{i},"line one\nline two"\n' for i in range(12))
+    assert app_module._count_csv_rows(quoted.encode()) == 12
+    trailing_blanks = 'a,b\n' + ''.join(f'{i},{i}\n' for i in range(25)) + '\n\n'
+    assert app_module._count_csv_rows(trailing_blanks.encode()) == 25
+    assert app_module._count_csv_rows(b'a,b\n') == 0
+
+
+def test_truncated_sniff_reports_the_full_row_count(monkeypatch):
+    monkeypatch.setattr(app_module, '_UPLOAD_SNIFF_ROWS', 5)
+    csv_text = 'Timestamp,Note\n' + ''.join(
+        f'2024-01-01 08:00:00,"multi\nline {i}"\n' for i in range(40)
+    ) + '\n'
+    sniff = app_module._parse_csv_sample(csv_text.encode())
+    assert sniff['row_count'] == 40
+    assert len(sniff['sample_data']) == 3
+
+
+def _suggested_mapping(headers):
+    controls, _, _ = app_module.create_intelligent_mapping_dropdowns_v6(headers)
+    return {
+        control.children[1].id['index']: control.children[1].value
+        for control in controls
+    }
+
+
+def test_mapping_suggests_columns_by_keyword():
+    assert _suggested_mapping(['Notes', 'Outcome', 'Reader', 'Badge', 'Date']) == {
+        'Timestamp': 'Date', 'UserID': 'Badge', 'DoorID': 'Reader', 'EventType': 'Outcome',
+    }
+
+
+def test_mapping_falls_back_to_fuzzy_then_position():
+    suggested = _suggested_mapping(['col_a', 'col_b', 'col_c', 'col_d', 'Tiemstamp'])
+    assert suggested['Timestamp'] == 'Tiemstamp'
+    assert (suggested['UserID'], suggested['DoorID'], suggested['EventType']) == (
+        'col_b', 'col_c', 'col_d'
+    )
+    assert _suggested_mapping(['x'])['DoorID'] is None
+
+
+def _callback_spec(name):
+    return next(spec for spec in app_module._CALLBACK_SPECS if spec[0] == name)
+
+
+def test_analysis_reads_the_file_from_the_upload_component():
+    _, args, _, _ = _callback_spec('generate_comprehensive_enhanced_analysis_v6')
+    states = args[2]
+    assert (states[0].component_id, states[0].component_property) == ('upload-data', 'contents')
+
+    outputs = [
+        output.component_id
+        for _, args, _, _ in app_module._CALLBACK_SPECS
+        for output in (args[0] if isinstance(args[0], list) else [args[0]])
+    ]
+    assert 'uploaded-file-store' not in outputs
+
+
+def test_analysis_without_processed_data_returns_the_empty_response():
+    response = app_module.generate_comprehensive_enhanced_analysis_v6(
+        1, 'data:text/csv;base64,' + _csv_payload(3), None,
+        ['Timestamp', 'UserID', 'DoorID', 'EventType'], [], [], [], 1, 'no',
+    )
+    assert response is app_module._NO_ANALYSIS_RESPONSE
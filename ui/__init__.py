@@ -2,17 +2,19 @@
 
 """UI package for the application."""
 
-# Import from components package
-from .components import (
-    EnhancedUploadComponent,
-    create_enhanced_upload_component,
-    create_upload_component,
-    create_simple_upload_component
-)
-
 __all__ = [
     'EnhancedUploadComponent',
     'create_enhanced_upload_component', 
     'create_upload_component',
     'create_simple_upload_component',
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    # Forward to the components package, which imports upload on first use
+    if name in __all__:
+        from . import components
+        value = getattr(components, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
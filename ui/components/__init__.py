@@ -2,17 +2,30 @@
 
 """UI components package."""
 
-# Clean imports - only import what actually exists
-from .upload import (
-    EnhancedUploadComponent,
-    create_enhanced_upload_component,
-    create_upload_component,
-    create_simple_upload_component
-)
+import importlib
+
+# Clean imports - only import what actually exists. The upload module is
+# resolved on first attribute access (PEP 562), so importing a sibling such
+# as ui.components.mapping does not also execute upload and its bootstrap
+# dependencies.
+_LAZY_EXPORTS = {
+    'EnhancedUploadComponent': '.upload',
+    'create_enhanced_upload_component': '.upload',
+    'create_upload_component': '.upload',
+    'create_simple_upload_component': '.upload',
+}
 
 __all__ = [
     'EnhancedUploadComponent',
     'create_enhanced_upload_component', 
     'create_upload_component',
     'create_simple_upload_component',
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
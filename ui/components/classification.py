@@ -3,6 +3,7 @@
 Door classification component with simplified toggle switch - FIXED
 """
 
+import functools
 from dash import html, dcc, callback, Input, Output
 import dash_bootstrap_components as dbc
 from ui.themes.style_config import (
@@ -375,6 +376,7 @@ class ClassificationComponent:
 
 
 # Factory functions for easy component creation
+@functools.lru_cache(maxsize=None)
 def create_classification_component():
-    """Factory function to create classification component instance"""
+    """Factory function returning the shared classification component instance"""
     return ClassificationComponent()
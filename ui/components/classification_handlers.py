@@ -19,6 +19,10 @@ from config.settings import REQUIRED_INTERNAL_COLUMNS
 
 logger = get_logger(__name__)
 
+# Visibility styles for the classification table, shared across toggles
+_TABLE_SHOW_STYLE = {'display': 'block'}
+_TABLE_HIDE_STYLE = {'display': 'none'}
+
 class ClassificationHandlers:
     def __init__(self, app, classification_component=None):
         self.app = app
@@ -46,7 +50,7 @@ class ClassificationHandlers:
             try:
                 content_type, content_string = uploaded_data.split(',', 1)
                 decoded = base64.b64decode(content_string)
-                df = pd.read_csv(io.StringIO(decoded.decode('utf-8')))
+                df = pd.read_csv(io.BytesIO(decoded), encoding='utf-8')
                 headers = df.columns.tolist()
 
                 mapping_store = json.loads(column_mapping) if isinstance(column_mapping, str) else column_mapping or {}
@@ -68,7 +72,7 @@ class ClassificationHandlers:
                 doors = sorted(df[door_col].astype(str).unique().tolist())
                 return self._generate_classification_table(doors, {}, 4)
             except Exception as e:
-                logger.info(f"Error generating classification table: {e}")
+                logger.info("Error generating classification table: %s", e)
                 return html.P("An error occurred during classification table generation.", style={'color': COLORS['critical']})
             
     def _register_classification_toggle_handler(self):
@@ -79,9 +83,7 @@ class ClassificationHandlers:
             prevent_initial_call=True
         )
         def toggle_classification_tools(manual_map_choice):
-            if manual_map_choice == 'yes':
-                return {'display': 'block'}
-            return {'display': 'none'}
+            return _TABLE_SHOW_STYLE if manual_map_choice == 'yes' else _TABLE_HIDE_STYLE
 
     def _register_floor_slider_display_handler(self):
         """Update floor display when slider value changes - FIXED with allow_duplicate"""
@@ -134,7 +136,7 @@ class ClassificationHandlers:
             # Handle slider value (ensure it's an integer)
             num_floors_int = int(num_floors) if num_floors is not None else 4
                 
-            logger.info(f"DEBUG: Generating classification table for {len(all_doors_from_store_data)} doors.")
+            logger.info("DEBUG: Generating classification table for %s doors.", len(all_doors_from_store_data))
             return self._generate_classification_table(
                 all_doors_from_store_data,
                 existing_saved_classifications,
@@ -214,11 +216,11 @@ class ClassificationHandlers:
                 num_floors=num_floors
             )
             
-            logger.info(f"DEBUG: Generated scrollable classification table with {len(all_doors_data)} doors.")
+            logger.info("DEBUG: Generated scrollable classification table with %s doors.", len(all_doors_data))
             return table_content
             
         except Exception as e:
-            logger.info(f"Error generating classification table: {e}")
+            logger.info("Error generating classification table: %s", e)
             return [html.P(f"Error generating classification table: {str(e)}", 
                           style={'color': 'red', 'textAlign': 'center'})]
 
@@ -433,16 +435,6 @@ class ClassificationDataProcessor:
                 distribution['regular'] += 1
         
         return distribution
-def _register_debug_toggle_handler(self):
-    """Debug callback to see what's happening with the toggle"""
-    @self.app.callback(
-        Output('processing-status', 'children', allow_duplicate=True),
-        Input('manual-map-toggle', 'value'),
-        prevent_initial_call='initial_duplicate'
-    )
-    def debug_toggle_change(value):
-        logger.info(f"DEBUG: Toggle changed to: {value}")
-        return f"Debug: Toggle is now '{value}'"
 
 # Factory functions for easy handler creation
 def create_classification_handlers(app, classification_component=None):
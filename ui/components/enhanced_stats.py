@@ -4,6 +4,7 @@ Enhanced Statistics component with comprehensive metrics, charts, and export fea
 Maintains exact same style as original stats while adding powerful new capabilities
 """
 
+import functools
 from dash import html, dcc, Input, Output, callback
 import dash_bootstrap_components as dbc
 import plotly.graph_objects as go
@@ -1165,6 +1166,7 @@ class EnhancedStatsComponent:
 
 
 # Factory function
+@functools.lru_cache(maxsize=None)
 def create_enhanced_stats_component():
-    """Factory function to create enhanced stats component"""
+    """Factory function returning the shared enhanced stats component instance"""
     return EnhancedStatsComponent()
\ No newline at end of file
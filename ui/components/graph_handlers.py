@@ -167,11 +167,11 @@ class ClassificationHandlers:
                 num_floors=num_floors
             )
             
-            logger.info(f"DEBUG: Generated scrollable classification table with {len(all_doors_data)} doors.")
+            logger.info("DEBUG: Generated scrollable classification table with %s doors.", len(all_doors_data))
             return table_content
             
         except Exception as e:
-            logger.info(f"Error generating classification table: {e}")
+            logger.info("Error generating classification table: %s", e)
             return [html.P(f"Error generating classification table: {str(e)}", 
                           style={'color': 'red', 'textAlign': 'center'})]
 
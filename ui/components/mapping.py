@@ -4,6 +4,7 @@ Column mapping component for CSV header mapping
 Extracted from core_layout.py and mapping_callbacks.py with consistent reduced width
 """
 
+import functools
 from dash import html, dcc
 import dash_bootstrap_components as dbc
 
@@ -286,8 +287,9 @@ class MappingValidator:
 
 
 # Factory functions for easy component creation
+@functools.lru_cache(maxsize=None)
 def create_mapping_component():
-    """Factory function to create mapping component instance"""
+    """Factory function returning the shared mapping component instance"""
     return MappingComponent()
 
 def create_mapping_validator():
@@ -7,7 +7,6 @@ import base64
 import pandas as pd
 import io
 import json
-import traceback
 from typing import Dict, Any, Optional, Tuple
 from dash import Input, Output, State, html, no_update
 
@@ -81,16 +80,16 @@ class SecureUploadHandlers:
                 )
 
             try:
-                logger.info(f"Processing upload: {filename}")
+                logger.info("Processing upload: %s", filename)
                 
                 # Decode file content
                 content_type, content_string = contents.split(',')
                 decoded = base64.b64decode(content_string)
                 
                 if filename.lower().endswith('.csv'):
-                    df_full_for_doors = pd.read_csv(io.StringIO(decoded.decode('utf-8')))
+                    df_full_for_doors = pd.read_csv(io.BytesIO(decoded), encoding='utf-8')
                 elif filename.lower().endswith('.json'):
-                    df_full_for_doors = pd.read_json(io.StringIO(decoded.decode('utf-8')))
+                    df_full_for_doors = pd.read_json(io.BytesIO(decoded), encoding='utf-8')
                 else:
                     raise ValueError("Uploaded file must be a CSV or JSON file.")
                 headers = df_full_for_doors.columns.tolist()
@@ -123,9 +122,9 @@ class SecureUploadHandlers:
                 
                 if DOORID_COL_DISPLAY in df_copy.columns:
                     all_unique_doors = sorted(df_copy[DOORID_COL_DISPLAY].astype(str).unique().tolist())
-                    logger.info(f"Extracted {len(all_unique_doors)} unique doors for classification.")
+                    logger.info("Extracted %s unique doors for classification.", len(all_unique_doors))
                 else:
-                    logger.warning(f"'{DOORID_COL_DISPLAY}' column not found after preliminary mapping.")
+                    logger.warning("'%s' column not found after preliminary mapping.", DOORID_COL_DISPLAY)
                     all_unique_doors = []
                 
                 # Create mapping dropdowns
@@ -154,8 +153,7 @@ class SecureUploadHandlers:
                 )
                 
             except Exception as e:
-                logger.error(f"Upload error for {filename}: {str(e)}")
-                traceback.print_exc()
+                logger.exception("Upload error for %s: %s", filename, e)
                 
                 error_message = f"Error processing '{filename}': {str(e)}"
                 processing_status_msg = error_message
@@ -3,20 +3,23 @@
 Enhanced statistics component with advanced metrics, charts, and export features
 """
 
+import functools
 from dash import html, dcc
 from ui.components.graph import create_graph_container ###
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 from plotly.graph_objs import Figure  # For proper type hints
-import pandas as pd
 import base64
 import io
 from datetime import datetime
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 from ui.themes.style_config import COLORS, UI_VISIBILITY, SPACING, BORDER_RADIUS, SHADOWS
 from config.settings import SECURITY_LEVELS
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 class EnhancedStatsComponent:
     """Enhanced statistics component with advanced analytics and visualizations"""
     
@@ -409,7 +412,7 @@ class EnhancedStatsComponent:
         
         return fig
     
-    def _normalize_security_column(self, series: pd.Series) -> pd.Series:
+    def _normalize_security_column(self, series: "pd.Series") -> "pd.Series":
         """Translate numeric security levels to their string color values."""
         level_map = {lvl: info['value'] for lvl, info in SECURITY_LEVELS.items()}
 
@@ -732,6 +735,8 @@ class EnhancedStatsComponent:
             else:
                 data.append({'Metric': key, 'Value': value})
         
+        import pandas as pd
+
         df = pd.DataFrame(data)
         
         # Convert to CSV
@@ -804,8 +809,9 @@ Report generated by Enhanced Analytics Dashboard
 
 
 # Factory functions for easy component creation
+@functools.lru_cache(maxsize=None)
 def create_enhanced_stats_component():
-    """Factory function to create enhanced stats component instance"""
+    """Factory function returning the shared enhanced stats component instance"""
     return EnhancedStatsComponent()
 
 # Backward compatibility
@@ -2,6 +2,7 @@
 """
 Upload component - Fixed for actual directory structure
 """
+import functools
 from dash import html, dcc
 import dash_bootstrap_components as dbc
 from typing import Dict, Any, Optional
@@ -117,8 +118,9 @@ class EnhancedUploadComponent:
 
 
 # Factory functions for easy component creation
+@functools.lru_cache(maxsize=4)
 def create_enhanced_upload_component(icon_default: str, icon_success: str, icon_fail: str):
-    """Factory function to create enhanced upload component"""
+    """Factory function to create enhanced upload component (cached per icon set)"""
     return EnhancedUploadComponent(icon_default, icon_success, icon_fail)
 
 def create_upload_component(icon_default: str, icon_success: str, icon_fail: str):
@@ -127,5 +129,5 @@ def create_upload_component(icon_default: str, icon_success: str, icon_fail: str
 
 def create_simple_upload_component(icon_path: str):
     """Create simple upload component with single icon"""
-    return EnhancedUploadComponent(icon_path, icon_path, icon_path)
+    return create_enhanced_upload_component(icon_path, icon_path, icon_path)
 
@@ -8,7 +8,6 @@ import base64
 import io
 import pandas as pd
 import json
-import traceback
 from dash import Input, Output, State, html, dcc
 
 # Import UI components
@@ -85,8 +84,7 @@ class UploadHandlers:
                 return self._create_error_response(result, upload_styles, filename)
                 
         except Exception as e:
-            logger.info(f"Error in handle_upload: {e}")
-            traceback.print_exc()
+            logger.exception("Error in handle_upload: %s", e)
             error_result = {'error': str(e), 'success': False}
             return self._create_error_response(error_result, upload_styles, filename)
     
@@ -98,9 +96,9 @@ class UploadHandlers:
             decoded = base64.b64decode(content_string)# Determine file type and load accordingly
             # Determine file type and load accordingly
             if filename.lower().endswith('.csv'):
-                df_full_for_doors = pd.read_csv(io.StringIO(decoded.decode('utf-8')))
+                df_full_for_doors = pd.read_csv(io.BytesIO(decoded), encoding='utf-8')
             elif filename.lower().endswith('.json'):
-                df_full_for_doors = pd.read_json(io.StringIO(decoded.decode('utf-8')))
+                df_full_for_doors = pd.read_json(io.BytesIO(decoded), encoding='utf-8')
             else:
                 raise ValueError("Uploaded file must be a CSV or JSON file.")
             headers = df_full_for_doors.columns.tolist()
@@ -167,10 +165,10 @@ class UploadHandlers:
         
         if DOORID_COL_DISPLAY in df_copy.columns:
             all_unique_doors = sorted(df_copy[DOORID_COL_DISPLAY].astype(str).unique().tolist())
-            logger.info(f"DEBUG: Extracted {len(all_unique_doors)} unique doors for classification.")
+            logger.info("DEBUG: Extracted %s unique doors for classification.", len(all_unique_doors))
             return all_unique_doors
         else:
-            logger.info(f"Warning: '{DOORID_COL_DISPLAY}' column not found after preliminary mapping.")
+            logger.info("Warning: '%s' column not found after preliminary mapping.", DOORID_COL_DISPLAY)
             return []
     
     def _create_mapping_dropdowns(self, headers, mapping_result):
@@ -65,13 +65,13 @@ class ErrorHandler:
         
         # Log the error
         self.logger.error(
-            f"Error {error_id}: {error_info['error_type']} - {error_info['error_message']}",
+            "Error %s: %s - %s", error_id, error_info['error_type'], error_info['error_message'],
             extra={'error_info': error_info, 'context': context}
         )
         
-        # Log stack trace for debugging
-        if self.logger.isEnabledFor(logging.DEBUG):
-            self.logger.debug(f"Stack trace for error {error_id}:", exc_info=True)
+        # Log stack trace for debugging, reusing the text formatted above
+        if error_info['traceback'] is not None:
+            self.logger.debug("Stack trace for error %s:\n%s", error_id, error_info['traceback'].rstrip())
         
         return error_info
     
@@ -44,9 +44,10 @@ def setup_application_logging(log_level='INFO', log_file=None):
     # File handler (optional)
     if log_file:
         try:
-            # Create logs directory if it doesn't exist
+            # makedirs(exist_ok=True) handles an existing directory; the guard
+            # only skips bare file names, whose dirname is ''
             log_dir = os.path.dirname(log_file)
-            if log_dir and not os.path.exists(log_dir):
+            if log_dir:
                 os.makedirs(log_dir, exist_ok=True)
             
             file_handler = logging.FileHandler(log_file)
@@ -54,17 +55,20 @@ def setup_application_logging(log_level='INFO', log_file=None):
             file_handler.setLevel(getattr(logging, log_level.upper(), logging.INFO))
             root_logger.addHandler(file_handler)
             
-            print(f"📝 Logging to file: {log_file}")
+            root_logger.debug("Logging to file: %s", log_file)
             
         except Exception as e:
-            print(f"⚠️ Could not set up file logging: {e}")
+            logger.warning("⚠️ Could not set up file logging: %s", e)
     
-    print(f"📊 Logging configured - Level: {log_level}")
+    logger.info("📊 Logging configured - Level: %s", log_level)
 
 def get_logger(name=None):
     """
     Get a logger instance
     
+    Handlers are not touched here; they are installed once by the entry
+    point through setup_application_logging(), or by the host server.
+    
     Args:
         name: Logger name (usually __name__)
         
@@ -74,13 +78,7 @@ def get_logger(name=None):
     if name is None:
         name = __name__
     
-    logger = logging.getLogger(name)
-    
-    # If no handlers are set up, create a simple console logger
-    if not logger.handlers and not logging.getLogger().handlers:
-        setup_simple_console_logging()
-    
-    return logger
+    return logging.getLogger(name)
 
 def setup_simple_console_logging():
     """Set up basic console logging as fallback"""
@@ -147,21 +145,11 @@ def get_safe_logger(name=None):
 # INITIALIZATION
 # ============================================================================
 
-# Set up basic logging on import
-try:
-    # Try to set up proper logging
-    setup_application_logging()
-except Exception as e:
-    # Fall back to basic logging
-    print(f"⚠️ Logging setup failed: {e}")
-    try:
-        setup_simple_console_logging()
-    except Exception:
-        print("⚠️ Even basic logging failed - using print statements")
-
-# Create default logger
-logger = get_safe_logger(__name__)
-logger.info("✅ Logging configuration loaded")
+# Handlers are installed by the entry point (app.py / app_production.py)
+# calling setup_application_logging() once; importing this module never
+# configures logging itself
+logger = logging.getLogger(__name__)
+logger.debug("Logging configuration loaded")
 
 # ============================================================================
 # EXPORTS